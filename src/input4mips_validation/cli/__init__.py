@@ -227,7 +227,8 @@ def validate_file(  # noqa: PLR0913
 
         if full_file_path.name != file.name:
             logger.info(f"Re-writing {file} to {full_file_path}")
-            Input4MIPsDataset.from_ds(ds, cvs=cvs).write(
+            # No need to copy, we don't use `ds` again.
+            Input4MIPsDataset.from_ds(ds, cvs=cvs, copy_ds=False).write(
                 root_data_dir=write_in_drs,
                 frequency_metadata_keys=frequency_metadata_keys,
                 time_dimension=time_dimension,
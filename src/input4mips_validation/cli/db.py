@@ -31,6 +31,7 @@ from input4mips_validation.database import (
     update_database_file_entries,
 )
 from input4mips_validation.database.creation import create_db_file_entries
+from input4mips_validation.file_search import iter_files_in_tree
 from input4mips_validation.inference.from_data import BoundsInfo, FrequencyMetadataKeys
 from input4mips_validation.validation.database import (
     validate_database_entries,
@@ -105,7 +106,7 @@ def db_create(  # noqa: PLR0913
     logger.debug(f"Creating {db_dir}")
     db_dir.mkdir(parents=True, exist_ok=False)
 
-    all_files = tuple(v for v in tree_root.rglob(rglob_input) if v.is_file())
+    all_files = tuple(iter_files_in_tree(tree_root, rglob_input))
 
     db_entries = create_db_file_entries(
         files=all_files,
@@ -270,7 +271,7 @@ def db_add_tree(  # noqa: PLR0913
 
         If `n_processes` is equal to 1, simply pass `None`.
     """
-    all_tree_files = set(tree_root.rglob(rglob_input))
+    all_tree_files = set(iter_files_in_tree(tree_root, rglob_input))
 
     db_existing_entries = load_database_file_entries(db_dir)
     known_files = set([Path(v.filepath) for v in db_existing_entries])
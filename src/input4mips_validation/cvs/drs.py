@@ -62,6 +62,14 @@ DataReferenceSyntaxUnstructured: TypeAlias = dict[str, str]
 DEFAULT_REPLACEMENTS: dict[str, str] = {".": "-"}
 """Default replacements for characters in directories and file names"""
 
+UNVERIFIABLE_KEYS_DIRECTORY: frozenset[str] = frozenset({"version"})
+"""
+Keys in the directory which can't be verified against the file's metadata
+
+These keys are unverifiable because we don't save this data anywhere in the file,
+and they can take any value.
+"""
+
 
 @frozen
 class DataReferenceSyntax:
@@ -539,6 +547,7 @@ class DataReferenceSyntax:
         file: Path,
         frequency_metadata_keys: FrequencyMetadataKeys = FrequencyMetadataKeys(),
         time_dimension: str = "time",
+        ds: xr.Dataset | None = None,
     ) -> None:
         """
         Validate that a file is correctly written in the DRS
@@ -554,6 +563,14 @@ class DataReferenceSyntax:
         time_dimension
             The time dimension of the data
 
+        ds
+            The file, already opened with [xr.open_dataset][xarray.open_dataset]
+            (with `use_cftime=True`).
+
+            If not supplied, we open `file`.
+            Supply this if you have already opened the file
+            to avoid opening it again.
+
         Raises
         ------
         ValueError
@@ -570,7 +587,9 @@ class DataReferenceSyntax:
             file.name
         )
 
-        ds = xr.open_dataset(file, use_cftime=True)
+        if ds is None:
+            ds = xr.open_dataset(file, use_cftime=True)
+
         comparison_metadata = {
             k: apply_known_replacements(v)
             for k, v in ds.attrs.items()
@@ -595,43 +614,41 @@ class DataReferenceSyntax:
 
             comparison_metadata["time_range"] = time_range
 
-        # This key is unverifiable because we don't save this data anywhere in the file,
-        # and it can take any value.
-        # TODO: infer this once we have the required_global_attributes
-        # handling implemented in the CVs.
-        unverifiable_keys_directory = ["version"]
-
-        mismatches = []
+        mismatches: list[tuple[str, str, str, str | None]] = []
         for k, v in directory_metadata.items():
             if v is None:
                 # No info in directory, presumably because key was optional
                 continue
 
-            if k in unverifiable_keys_directory:
+            # TODO: verify these once we have the required_global_attributes
+            # handling implemented in the CVs.
+            if k in UNVERIFIABLE_KEYS_DIRECTORY:
                 continue
 
-            if comparison_metadata[k] != v:
-                mismatches.append(
-                    [k, "directory", directory_metadata[k], comparison_metadata[k]]
-                )
+            expected_val = comparison_metadata.get(k)
+            if expected_val != v:
+                mismatches.append((k, "directory", v, expected_val))
 
         for k, v in file_metadata.items():
             if v is None:
                 # No info in filename, presumably because key was optional
                 continue
 
+            expected_val = comparison_metadata.get(k)
+            if expected_val is None:
+                mismatches.append((k, "filename", v, expected_val))
+                continue
+
             # In the filename, underscore
             # can be swapped for hyphen to avoid delimiter issues.
             # Burying this here feels too deep,
             # but I don't know how to express this in a more obvious way.
             valid_filename_values = {
-                comparison_metadata[k],
-                apply_known_replacements(comparison_metadata[k], {"_": "-"}),
+                expected_val,
+                apply_known_replacements(expected_val, {"_": "-"}),
             }
             if v not in valid_filename_values:
-                mismatches.append(
-                    [k, "filename", file_metadata[k], comparison_metadata[k]]
-                )
+                mismatches.append((k, "filename", v, expected_val))
 
         if mismatches:
             msg_l = [
@@ -4,7 +4,8 @@ Dataset class definition
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import multiprocessing
+from collections.abc import Hashable, Iterable
 from pathlib import Path
 from typing import Any, Optional, Protocol
 
@@ -39,6 +40,7 @@ from input4mips_validation.io import (
     generate_creation_timestamp,
     generate_tracking_id,
 )
+from input4mips_validation.parallelisation import run_parallel
 from input4mips_validation.validation.datasets_to_write_to_disk import (
     get_ds_to_write_to_disk_validation_result,
 )
@@ -55,6 +57,13 @@ This is a global variable because this value is currently hard-coded in cf-xarra
 See https://github.com/xarray-contrib/cf-xarray/blob/22ee634433b988bd101e45e9f9728bbf59915259/cf_xarray/accessor.py#L2507.
 """
 
+INPUT4MIPS_METADATA_FIELD_NAMES: frozenset[str] = frozenset(
+    f.name for f in fields(Input4MIPsDatasetMetadata)
+)
+"""
+Names of the fields of [`Input4MIPsDatasetMetadata`][input4mips_validation.dataset.metadata.Input4MIPsDatasetMetadata]
+"""  # noqa: E501
+
 
 class PrepareFuncLike(Protocol):
     """
@@ -142,7 +151,7 @@ class Input4MIPsDataset:
         if value is None:
             return
 
-        clashing_keys = [key for key in value if key in asdict(self.metadata).keys()]
+        clashing_keys = sorted(value.keys() & INPUT4MIPS_METADATA_FIELD_NAMES)
         if clashing_keys:
             msg = (
                 f"{attribute.name} must not contain any keys "
@@ -160,6 +169,7 @@ class Input4MIPsDataset:
         cls,
         ds: xr.Dataset,
         cvs: Input4MIPsCVs | None,
+        copy_ds: bool = True,
     ) -> Input4MIPsDataset:
         """
         Initialise from an existing dataset
@@ -173,22 +183,32 @@ class Input4MIPsDataset:
         cvs
             Controlled vocabularies to use with the dataset
 
+        copy_ds
+            Should `ds` be copied before we create the `Input4MIPsDataset`?
+
+            If `False`, the attributes of `ds` are removed in place
+            (they are moved onto the metadata of the created instance).
+
         Returns
         -------
             Initialised instance
         """
-        ds_stripped = ds.copy()
-        ds_stripped.attrs = {}
+        metadata_kwargs: dict[str, Any] = {}
+        non_input4mips_metadata: dict[str, Any] = {}
+        for k, v in ds.attrs.items():
+            if k in INPUT4MIPS_METADATA_FIELD_NAMES:
+                metadata_kwargs[k] = v
+            else:
+                non_input4mips_metadata[k] = v
 
-        metadata_fields = [
-            f.name for f in fields(Input4MIPsDatasetMetadata) if f.name in ds.attrs
-        ]
-        metadata = Input4MIPsDatasetMetadata(
-            **{k: ds.attrs[k] for k in metadata_fields}
-        )
-        non_input4mips_metadata = {
-            k: v for k, v in ds.attrs.items() if k not in metadata_fields
-        }
+        metadata = Input4MIPsDatasetMetadata(**metadata_kwargs)
+
+        if copy_ds:
+            ds_stripped = ds.copy()
+        else:
+            ds_stripped = ds
+
+        ds_stripped.attrs = {}
 
         if cvs is None:
             res = Input4MIPsDataset(
@@ -301,6 +321,12 @@ class Input4MIPsDataset:
         if cvs_source_id_values.license_id is None:
             msg = "License ID must be specified in the CVs source ID"
             raise AssertionError(msg)
+
+        # Look the license up once, rather than chasing through the entries
+        # while building the metadata.
+        license_conditions = cvs.license_entries[
+            cvs_source_id_values.license_id
+        ].values.conditions
         ### End of identical lines
 
         if dataset_category is None:
@@ -319,9 +345,7 @@ class Input4MIPsDataset:
             # # TODO: look this up from central CVs
             # institution=cvs_source_id_values.institution,
             institution_id=cvs_source_id_values.institution_id,
-            license=cvs.license_entries[
-                cvs_source_id_values.license_id
-            ].values.conditions,
+            license=license_conditions,
             license_id=cvs_source_id_values.license_id,
             mip_era=cvs_source_id_values.mip_era,
             nominal_resolution=metadata_minimum.nominal_resolution,
@@ -419,6 +443,12 @@ class Input4MIPsDataset:
         if cvs_source_id_values.license_id is None:
             msg = "License ID must be specified in the CVs source ID"
             raise AssertionError(msg)
+
+        # Look the license up once, rather than chasing through the entries
+        # while building the metadata.
+        license_conditions = cvs.license_entries[
+            cvs_source_id_values.license_id
+        ].values.conditions
         ### End of identical lines
 
         metadata = Input4MIPsDatasetMetadata(
@@ -431,9 +461,7 @@ class Input4MIPsDataset:
             # # TODO: look this up from central CVs
             # institution=cvs_values.institution,
             institution_id=cvs_source_id_values.institution_id,
-            license=cvs.license_entries[
-                cvs_source_id_values.license_id
-            ].values.conditions,
+            license=license_conditions,
             license_id=cvs_source_id_values.license_id,
             mip_era=cvs_source_id_values.mip_era,
             nominal_resolution=metadata_minimum.nominal_resolution,
@@ -495,35 +523,31 @@ class Input4MIPsDataset:
         """
         cvs = self.cvs
 
-        # Can shallow copy as we don't alter the data from here on
-        ds_disk = self.data.copy(deep=False)
-        try:
-            ds_disk = ds_disk.pint.dequantify(format=pint_dequantify_format)
-        except AttributeError:
+        if hasattr(self.data, "pint"):
+            # Dequantifying returns a new object,
+            # so there is no need to copy first.
+            ds_disk = self.data.pint.dequantify(format=pint_dequantify_format)
+        else:
             logger.debug(
                 "Not dequantifying with pint, "
                 "I assume you know what you're doing with units"
             )
-
-        # Add all the metadata
-        ds_disk.attrs = convert_input4mips_metadata_to_ds_attrs(self.metadata)
-        if self.non_input4mips_metadata is not None:
-            # Merge the metadata.
-            # Validation ensures that there will be no clash of keys.
-            ds_disk.attrs = (
-                self.non_input4mips_metadata
-                | convert_input4mips_metadata_to_ds_attrs(self.metadata)
-            )
-
-        else:
-            ds_disk.attrs = convert_input4mips_metadata_to_ds_attrs(self.metadata)
-
-        # Must be unique for every written file,
-        # so we deliberately don't provide a way
-        # for the user to overwrite this at present
-        # and we deliberately overwrite any existing values.
-        ds_disk.attrs["tracking_id"] = generate_tracking_id()
-        ds_disk.attrs["creation_date"] = generate_creation_timestamp()
+            # Can shallow copy as we don't alter the data from here on
+            ds_disk = self.data.copy(deep=False)
+
+        # Add all the metadata.
+        # Validation ensures that there will be no clash of keys
+        # between the input4MIPs and non-input4MIPs metadata.
+        ds_disk.attrs = {
+            **(self.non_input4mips_metadata or {}),
+            **convert_input4mips_metadata_to_ds_attrs(self.metadata),
+            # Must be unique for every written file,
+            # so we deliberately don't provide a way
+            # for the user to overwrite this at present
+            # and we deliberately overwrite any existing values.
+            "tracking_id": generate_tracking_id(),
+            "creation_date": generate_creation_timestamp(),
+        }
 
         time_start, time_end = infer_time_start_time_end_for_filename(
             ds=ds_disk,
@@ -634,6 +658,61 @@ class Input4MIPsDataset:
         return out_path
 
 
+def write_many(  # noqa: PLR0913
+    datasets: Iterable[Input4MIPsDataset],
+    root_data_dir: Path,
+    n_processes: int = 1,
+    mp_context: multiprocessing.context.BaseContext | None = None,
+    **kwargs: Any,
+) -> tuple[Path, ...]:
+    """
+    Write many datasets to disk
+
+    Parameters
+    ----------
+    datasets
+        Datasets to write
+
+    root_data_dir
+        Root directory in which to write the files
+
+    n_processes
+        Number of parallel processes to use while writing the files.
+
+        We use processes rather than threads
+        because the underlying netCDF/HDF5 libraries are not thread-safe.
+
+    mp_context
+        Multiprocessing context to use.
+
+        If `n_processes` is equal to 1, simply pass `None`.
+        If `n_processes` is greater than 1 and you pass `None`,
+        a default context will be created and used.
+
+    **kwargs
+        Passed to [`write`][input4mips_validation.dataset.Input4MIPsDataset.write]
+        for every dataset.
+
+    Returns
+    -------
+    :
+        Paths in which the datasets were written.
+
+        These are in the same order as `datasets`.
+    """
+    written_paths = run_parallel(
+        func_to_call=Input4MIPsDataset.write,
+        iterable_input=datasets,
+        input_desc="datasets",
+        n_processes=n_processes,
+        mp_context=mp_context,
+        root_data_dir=root_data_dir,
+        **kwargs,
+    )
+
+    return written_paths
+
+
 def prepare_ds_and_get_frequency(  # noqa: PLR0913
     ds_raw: xr.Dataset,
     dimensions: tuple[str, ...] | None = None,
@@ -642,6 +721,7 @@ def prepare_ds_and_get_frequency(  # noqa: PLR0913
     bounds_info: BoundsInfo = BoundsInfo(time_bounds=f"time{CF_XARRAY_BOUNDS_SUFFIX}"),
     standard_and_or_long_names: dict[str, dict[str, str]] | None = None,
     guess_coord_axis: bool = True,
+    add_canonical_attributes: bool = True,
     copy_ds: bool = False,
     no_time_axis_frequency: str = "fx",
 ) -> tuple[xr.Dataset, str]:
@@ -698,6 +778,13 @@ def prepare_ds_and_get_frequency(  # noqa: PLR0913
     guess_coord_axis
         Should we guess the co-ordinate axes of the dataset?
 
+    add_canonical_attributes
+        Should we add canonical CF attributes to the variables in the dataset?
+
+        If your data already has CF-canonical attributes,
+        setting this to `False` avoids the (relatively expensive)
+        traversal of all the variables in the dataset.
+
     copy_ds
         Should we copy `ds_raw` before modifying the metadata
         or simply modify the existing dataset?
@@ -727,7 +814,9 @@ def prepare_ds_and_get_frequency(  # noqa: PLR0913
 
     if guess_coord_axis:
         ds = ds.cf.guess_coord_axis()
-    ds = ds.cf.add_canonical_attributes()
+
+    if add_canonical_attributes:
+        ds = ds.cf.add_canonical_attributes()
 
     ds = handle_ds_standard_long_names(
         ds,
@@ -750,9 +839,9 @@ def prepare_ds_and_get_frequency(  # noqa: PLR0913
         bounds_dim_upper_val=bounds_info.bounds_dim_upper_val,
     )
 
-    if time_dimension in ds:
-        # Make sure time appears first as this is what CF conventions expect
-        ds = ds.transpose(time_dimension, ...)
+    # Make sure time appears first as this is what CF conventions expect
+    # (fixed fields, i.e. data without a time dimension, are left as they are).
+    ds = ds.transpose(time_dimension, ..., missing_dims="ignore")
 
     return ds, frequency
 
@@ -815,7 +904,7 @@ def add_bounds(  # noqa: PLR0913
         ds = ds.copy()
 
     if dimensions is None:
-        dimensions_use: Iterable[str] = tuple(str(v) for v in ds.dims)
+        dimensions_use: Iterable[str] = tuple(map(str, ds.dims))
     else:
         dimensions_use = dimensions
 
@@ -843,8 +932,16 @@ def add_bounds(  # noqa: PLR0913
     else:
         add_time_bounds_use = add_time_bounds
 
+    # Consecutive non-time dimensions are added in one go with cf-xarray,
+    # which saves re-creating the dataset for every dimension.
+    # The bounds are still added in the same order as `dimensions_use`,
+    # so the order of variables in the output doesn't change.
+    non_time_dimensions: list[str] = []
     for dim in dimensions_use:
         if dim == time_dimension:
+            ds = add_non_time_bounds(ds, non_time_dimensions, bounds_dim=bounds_dim)
+            non_time_dimensions = []
+
             if is_climatology:
                 # Climatologies don't have bounds, they have climatology info instead.
                 continue
@@ -852,10 +949,47 @@ def add_bounds(  # noqa: PLR0913
             ds = add_time_bounds_use(ds, output_dim_bounds=bounds_dim)
 
         else:
-            ds = ds.cf.add_bounds(dim, output_dim=bounds_dim)
-            # Remove the bounds variable from co-ordinates
-            # to avoid iris screaming about CF-conventions later.
-            ds = ds.reset_coords(f"{dim}{CF_XARRAY_BOUNDS_SUFFIX}")
+            non_time_dimensions.append(dim)
+
+    ds = add_non_time_bounds(ds, non_time_dimensions, bounds_dim=bounds_dim)
+
+    return ds
+
+
+def add_non_time_bounds(
+    ds: xr.Dataset, dimensions: list[str], bounds_dim: str = "bounds"
+) -> xr.Dataset:
+    """
+    Add bounds for non-time dimensions to a dataset
+
+    This uses [`cf_xarray`](https://github.com/xarray-contrib/cf-xarray)
+    to add the bounds for all of `dimensions` in one go.
+
+    Parameters
+    ----------
+    ds
+        Dataset to which to add bounds
+
+    dimensions
+        Dimensions for which to add bounds.
+
+        If this is empty, `ds` is returned unchanged.
+
+    bounds_dim
+        Name of the bounds dimension
+
+    Returns
+    -------
+    :
+        Dataset with bounds added for `dimensions`
+    """
+    if not dimensions:
+        return ds
+
+    ds = ds.cf.add_bounds(dimensions, output_dim=bounds_dim)
+    # Remove the bounds variables from co-ordinates
+    # to avoid iris screaming about CF-conventions later.
+    ds = ds.reset_coords([f"{dim}{CF_XARRAY_BOUNDS_SUFFIX}" for dim in dimensions])
 
     return ds
 
@@ -887,6 +1021,10 @@ def handle_ds_standard_long_names(
     bounds_indicator
         String which indicates that the variable is a bounds variable.
 
+        A variable is treated as a bounds variable if it is referenced
+        by another variable's `bounds` or `climatology` attribute,
+        if its name is `bounds_indicator`
+        or if its name ends with `f"_{bounds_indicator}"`.
         These variables don't need standard/long name information.
 
     copy_ds
@@ -909,49 +1047,90 @@ def handle_ds_standard_long_names(
     KeyError
         No standard or long name information for a variable is provided.
     """
+    bounds_variables = get_ds_bounds_variables(ds, bounds_indicator=bounds_indicator)
+    missing_names = [
+        ds_variable
+        for ds_variable in [*ds.data_vars, *ds.coords]
+        if ds_variable not in bounds_variables
+        and not any(k in ds[ds_variable].attrs for k in ["standard_name", "long_name"])
+    ]
+    if not missing_names:
+        # Nothing to set, so no need to copy either
+        return ds
+
     if copy_ds:
         ds = ds.copy()
 
-    for ds_variable in [*ds.data_vars, *ds.coords]:
-        if bounds_indicator in ds_variable:
-            continue
-
-        if not any(k in ds[ds_variable].attrs for k in ["standard_name", "long_name"]):
-            # Ensure these key IDs are there
-            if standard_and_or_long_names is None:
-                msg = (
-                    f"Variable {ds_variable} "
-                    "does not have either standard_name or long_name set. "
-                    "Hence you must supply `standard_and_or_long_names`."
-                )
-                raise ValueError(msg)
-
-            try:
-                var_info = standard_and_or_long_names[ds_variable]
-            except KeyError as exc:
-                msg = f"Standard or long name for {ds_variable} must be supplied"
-                raise KeyError(msg) from exc
-
-            if "standard_name" in var_info:
-                ds[ds_variable].attrs["standard_name"] = var_info["standard_name"]
-
-            if "long_name" in var_info:
-                ds[ds_variable].attrs["long_name"] = var_info["long_name"]
-
-            if (
-                "standard_name" not in ds[ds_variable].attrs
-                and "long_name" not in ds[ds_variable].attrs
-            ):
-                msg = (
-                    "One of standard_name and long_name "
-                    "must be in ds[ds_variable].attrs. "
-                    f"Received {ds[ds_variable].attrs=}"
-                )
-                raise ValueError(msg)
+    for ds_variable in missing_names:
+        # Ensure these key IDs are there
+        if standard_and_or_long_names is None:
+            msg = (
+                f"Variable {ds_variable} "
+                "does not have either standard_name or long_name set. "
+                "Hence you must supply `standard_and_or_long_names`."
+            )
+            raise ValueError(msg)
+
+        try:
+            var_info = standard_and_or_long_names[ds_variable]
+        except KeyError as exc:
+            msg = f"Standard or long name for {ds_variable} must be supplied"
+            raise KeyError(msg) from exc
+
+        if "standard_name" in var_info:
+            ds[ds_variable].attrs["standard_name"] = var_info["standard_name"]
+
+        if "long_name" in var_info:
+            ds[ds_variable].attrs["long_name"] = var_info["long_name"]
+
+        if (
+            "standard_name" not in ds[ds_variable].attrs
+            and "long_name" not in ds[ds_variable].attrs
+        ):
+            msg = (
+                "One of standard_name and long_name "
+                "must be in ds[ds_variable].attrs. "
+                f"Received {ds[ds_variable].attrs=}"
+            )
+            raise ValueError(msg)
 
     return ds
 
 
+def get_ds_bounds_variables(ds: xr.Dataset, bounds_indicator: str) -> set[Hashable]:
+    """
+    Get the bounds variables in a dataset
+
+    Parameters
+    ----------
+    ds
+        Dataset from which to retrieve the bounds variables
+
+    bounds_indicator
+        String which indicates that the variable is a bounds variable.
+
+        See [`handle_ds_standard_long_names`][input4mips_validation.dataset.dataset.handle_ds_standard_long_names]
+        for details.
+
+    Returns
+    -------
+    :
+        Names of the bounds variables in `ds`
+    """  # noqa: E501
+    bounds_suffix = f"_{bounds_indicator}"
+
+    res: set[Hashable] = set()
+    for name, variable in ds.variables.items():
+        if name == bounds_indicator or str(name).endswith(bounds_suffix):
+            res.add(name)
+
+        for bounds_key in ("bounds", "climatology"):
+            if bounds_key in variable.attrs:
+                res.add(variable.attrs[bounds_key])
+
+    return res
+
+
 def get_ds_var_assert_single(ds: xr.Dataset) -> str:
     """
     Get a [xarray.Dataset][]'s variable, asserting that there is only one
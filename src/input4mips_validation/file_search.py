@@ -0,0 +1,57 @@
+"""
+Finding files within a tree
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+
+def iter_files_in_tree(root: Path, pattern: str = "*") -> Iterator[Path]:
+    """
+    Iterate over the files within a tree
+
+    This is equivalent to `(v for v in root.rglob(pattern) if v.is_file())`,
+    but is built directly on [os.scandir][].
+    The type of each entry is taken from the directory listing,
+    so we don't have to stat every path
+    and only create [Path][pathlib.Path]'s for the files we return.
+    Files are yielded as they are found,
+    so callers can start processing before the whole tree has been walked.
+
+    Like [Path.rglob][pathlib.Path.rglob],
+    symlinks to directories are not followed.
+
+    Parameters
+    ----------
+    root
+        Root of the tree
+
+    pattern
+        Pattern which file names must match to be yielded.
+
+        If `pattern` contains a path separator,
+        we fall back to using [Path.rglob][pathlib.Path.rglob]
+        as the pattern can't be matched against file names alone.
+
+    Yields
+    ------
+    :
+        Files within the tree which match `pattern`
+    """
+    if os.sep in pattern or "/" in pattern:
+        yield from (v for v in root.rglob(pattern) if v.is_file())
+        return
+
+    dirs_to_search = [os.fspath(root)]
+    while dirs_to_search:
+        with os.scandir(dirs_to_search.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs_to_search.append(entry.path)
+
+                elif entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                    yield Path(entry.path)
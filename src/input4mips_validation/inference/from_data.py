@@ -5,17 +5,20 @@ Inference of metadata from data
 from __future__ import annotations
 
 import datetime as dt
-from functools import partial
 from typing import Union
 
 import cftime
 import numpy as np
+import numpy.typing as npt
 import xarray as xr
 from attrs import define
 from loguru import logger
 
 from input4mips_validation.serialisation import format_date_for_time_range
-from input4mips_validation.xarray_helpers.time import xr_time_min_max_to_single_value
+from input4mips_validation.xarray_helpers.time import (
+    MONTHS_PER_YEAR,
+    xr_time_min_max_to_single_value,
+)
 
 
 @define
@@ -39,6 +42,12 @@ class FrequencyMetadataKeys:
     """
 
 
+CLIMATOLOGY_FREQUENCIES: frozenset[str] = frozenset({"monC"})
+"""
+Values of the frequency metadata which indicate that the data is a climatology
+"""
+
+
 def ds_is_climatology(ds: xr.Dataset, time_dimension: str) -> bool:
     """
     Determine whether a dataset represents a climatology or not
@@ -120,7 +129,7 @@ def frequency_is_climatology(frequency: str) -> bool:
     :
         Whether the data represents a climatology or not
     """
-    return frequency in {"monC"}
+    return frequency in CLIMATOLOGY_FREQUENCIES
 
 
 @define
@@ -214,13 +223,17 @@ class BoundsInfo:
                 )
                 raise AssertionError(msg)
 
+        # Read the values once,
+        # rather than going through xarray for the size check and each reduction
+        bounds_dim_values = ds[bounds_dim].values
+
         # Upper, lower
         bounds_dim_expected_size = 2
-        if ds[bounds_dim].size != bounds_dim_expected_size:
-            raise AssertionError(ds[bounds_dim].size)
+        if bounds_dim_values.size != bounds_dim_expected_size:
+            raise AssertionError(bounds_dim_values.size)
 
-        bounds_dim_upper_val = int(ds[bounds_dim].max().values.squeeze())
-        bounds_dim_lower_val = int(ds[bounds_dim].min().values.squeeze())
+        bounds_dim_upper_val = int(bounds_dim_values.max())
+        bounds_dim_lower_val = int(bounds_dim_values.min())
 
         return cls(
             time_bounds=time_bounds,
@@ -238,6 +251,7 @@ def infer_frequency(  # noqa: PLR0913
     bounds_dim: str = "bounds",
     bounds_dim_lower_val: int = 0,
     bounds_dim_upper_val: int = 1,
+    frequency_metadata_key: str | None = None,
 ) -> str:
     """
     Infer frequency from data
@@ -273,6 +287,20 @@ def infer_frequency(  # noqa: PLR0913
     bounds_dim_upper_val
         Value of the upper bounds dimension, which allows us to select the upper bounds.
 
+    frequency_metadata_key
+        The key in `ds.attrs` which points to the declared frequency of the data.
+
+        If supplied and `ds.attrs` contains this key,
+        the declared frequency is only checked against
+        a small sample of the time axis rather than the entire time axis.
+        If the sample is consistent with the declared frequency,
+        the declared frequency is returned.
+        Otherwise, we fall back to inferring the frequency from the full time axis.
+
+        This is much faster for large (particularly lazily loaded) datasets,
+        but should not be used when the point is to validate
+        the declared frequency, as only a sample of the data is checked.
+
     Returns
     -------
     :
@@ -285,6 +313,43 @@ def infer_frequency(  # noqa: PLR0913
 
     climatology = ds_is_climatology(ds, time_dimension)
 
+    # For tiny time axes, there is nothing to gain from sampling
+    min_time_axis_size_for_sampling = 3
+    if (
+        frequency_metadata_key is not None
+        and frequency_metadata_key in ds.attrs
+        and ds.sizes[time_dimension] >= min_time_axis_size_for_sampling
+    ):
+        declared_frequency = ds.attrs[frequency_metadata_key]
+        if climatology:
+            # Need consecutive time points for climatologies
+            probe_indexes = [0, 1]
+        else:
+            # Each bound is a step, so we can just look at the first and last steps
+            probe_indexes = [0, -1]
+
+        try:
+            probe_frequency: str | None = infer_frequency(
+                ds.isel({time_dimension: probe_indexes}),
+                no_time_axis_frequency=no_time_axis_frequency,
+                time_dimension=time_dimension,
+                time_bounds=time_bounds,
+                bounds_dim=bounds_dim,
+                bounds_dim_lower_val=bounds_dim_lower_val,
+                bounds_dim_upper_val=bounds_dim_upper_val,
+            )
+        except NotImplementedError:
+            probe_frequency = None
+
+        if probe_frequency is not None and probe_frequency == declared_frequency:
+            return probe_frequency
+
+        logger.debug(
+            f"Declared frequency ({declared_frequency!r}) "
+            f"is not consistent with the sample of the data ({probe_frequency!r}), "
+            "inferring the frequency from the full time axis"
+        )
+
     frequency_stem = get_frequency_label_stem(
         ds=ds,
         climatology=climatology,
@@ -309,12 +374,12 @@ def infer_frequency(  # noqa: PLR0913
     return frequency_label
 
 
-def is_yearly_steps(
+def get_month_year_diffs(
     step_start: xr.DataArray,
     step_end: xr.DataArray,
-) -> bool:
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]:
     """
-    Determine whether the steps are yearly
+    Get the difference in months and years between the start and end of each step
 
     Parameters
     ----------
@@ -326,38 +391,67 @@ def is_yearly_steps(
 
     Returns
     -------
-    :
-        `True` if the steps are yearly, otherwise `False`
+    month_diff :
+        Difference in month between the end and start of each step.
+
+        This ignores the year i.e. is in the range -11 to 11.
+
+    year_diff :
+        Difference in year between the end and start of each step
     """
     month_diff = step_end.dt.month.values - step_start.dt.month.values
     year_diff = step_end.dt.year.values - step_start.dt.year.values
 
-    is_yearly_steps = ((month_diff == 0) & (year_diff == 1)).all()
+    return month_diff, year_diff
 
-    return bool(is_yearly_steps)
 
+def month_year_diffs_are_yearly(
+    month_diff: npt.NDArray[np.int_], year_diff: npt.NDArray[np.int_]
+) -> bool:
+    """
+    Determine whether month and year differences represent yearly steps
 
-def is_monthly_steps(
-    step_start: xr.DataArray,
-    step_end: xr.DataArray,
+    Parameters
+    ----------
+    month_diff
+        Difference in months between the end and start of each step
+
+    year_diff
+        Difference in years between the end and start of each step
+
+    Returns
+    -------
+    :
+        `True` if the steps are yearly, otherwise `False`
+    """
+    # Cheap check of the first step before checking the whole array
+    if month_diff.size and (month_diff[0] != 0 or year_diff[0] != 1):
+        return False
+
+    return bool(np.all(month_diff == 0) and np.all(year_diff == 1))
+
+
+def month_year_diffs_are_monthly(
+    month_diff: npt.NDArray[np.int_], year_diff: npt.NDArray[np.int_]
 ) -> bool:
     """
-    Determine whether the steps are monthly
+    Determine whether month and year differences represent monthly steps
 
     Parameters
     ----------
-    step_start
-        Start of each step (e.g. start of each bound)
+    month_diff
+        Difference in months between the end and start of each step
 
-    step_end
-        End of each step (e.g. end of each bound)
+    year_diff
+        Difference in years between the end and start of each step
 
     Returns
     -------
     :
         `True` if the steps are monthly, otherwise `False`
     """
-    # # Urgh this doesn't work because October 5 to October 14 1582 (inclusive)
+    # # Urgh we can't use the number of days in each step
+    # # because October 5 to October 14 1582 (inclusive)
     # # don't exist in the mixed Julian/Gregorian calendar,
     # # so you don't get the right number of days for October 1582
     # # if you do it like this.
@@ -372,19 +466,63 @@ def is_monthly_steps(
     # ).all()
     # ```
     #
-    # # Hence have to use the hack below instead.
-    month_diff = step_end.dt.month.values - step_start.dt.month.values
-    year_diff = step_end.dt.year.values - step_start.dt.year.values
-
-    MONTH_DIFF_IF_END_OF_YEAR = -11
-    is_monthly_steps = (
-        (month_diff == 1)
-        | ((month_diff == MONTH_DIFF_IF_END_OF_YEAR) & (year_diff == 1))
-    ).all()
+    # # Hence have to use the hack below instead:
+    # # the total number of months in each step must be one.
+    is_monthly_steps = np.all(year_diff * MONTHS_PER_YEAR + month_diff == 1)
 
     return bool(is_monthly_steps)
 
 
+def is_yearly_steps(
+    step_start: xr.DataArray,
+    step_end: xr.DataArray,
+) -> bool:
+    """
+    Determine whether the steps are yearly
+
+    Parameters
+    ----------
+    step_start
+        Start of each step (e.g. start of each bound)
+
+    step_end
+        End of each step (e.g. end of each bound)
+
+    Returns
+    -------
+    :
+        `True` if the steps are yearly, otherwise `False`
+    """
+    return month_year_diffs_are_yearly(
+        *get_month_year_diffs(step_start=step_start, step_end=step_end)
+    )
+
+
+def is_monthly_steps(
+    step_start: xr.DataArray,
+    step_end: xr.DataArray,
+) -> bool:
+    """
+    Determine whether the steps are monthly
+
+    Parameters
+    ----------
+    step_start
+        Start of each step (e.g. start of each bound)
+
+    step_end
+        End of each step (e.g. end of each bound)
+
+    Returns
+    -------
+    :
+        `True` if the steps are monthly, otherwise `False`
+    """
+    return month_year_diffs_are_monthly(
+        *get_month_year_diffs(step_start=step_start, step_end=step_end)
+    )
+
+
 def get_frequency_label_stem(  # noqa: PLR0913
     ds: xr.Dataset,
     climatology: bool,
@@ -433,27 +571,48 @@ def get_frequency_label_stem(  # noqa: PLR0913
         [`infer_frequency`][input4mips_validation.inference.from_data.infer_frequency].
     """
     if climatology:
-        # Only have time to work with, no bounds
-        step_start = ds[time_dimension].isel(time=slice(None, -1))
-        step_end = ds[time_dimension].isel(time=slice(1, None))
+        # Only have time to work with, no bounds.
+        # Extract the months and years once, then difference consecutive values.
+        time = ds[time_dimension]
+        month_diff = np.diff(time.dt.month.values)
+        year_diff = np.diff(time.dt.year.values)
 
     else:
-        step_start = ds[time_bounds].sel({bounds_dim: bounds_dim_lower_val})
-        step_end = ds[time_bounds].sel({bounds_dim: bounds_dim_upper_val})
+        # Index the underlying variable positionally,
+        # rather than going through xarray's label-based selection
+        # (and re-building the co-ordinates and indexes) for each bound.
+        if bounds_dim in ds.indexes:
+            bounds_index = ds.indexes[bounds_dim]
+            lower_pos = bounds_index.get_loc(bounds_dim_lower_val)
+            upper_pos = bounds_index.get_loc(bounds_dim_upper_val)
 
-    if is_yearly_steps(
-        step_start=step_start,
-        step_end=step_end,
-    ):
+        else:
+            # Without an index, selecting by value is selecting by position
+            lower_pos, upper_pos = bounds_dim_lower_val, bounds_dim_upper_val
+
+        time_bounds_variable = ds[time_bounds].variable
+        step_start = xr.DataArray(time_bounds_variable.isel({bounds_dim: lower_pos}))
+        step_end = xr.DataArray(time_bounds_variable.isel({bounds_dim: upper_pos}))
+        month_diff, year_diff = get_month_year_diffs(
+            step_start=step_start, step_end=step_end
+        )
+
+    if month_year_diffs_are_yearly(month_diff=month_diff, year_diff=year_diff):
         return "yr"
 
-    if is_monthly_steps(
-        step_start=step_start,
-        step_end=step_end,
-    ):
+    if month_year_diffs_are_monthly(month_diff=month_diff, year_diff=year_diff):
         return "mon"
 
-    time_deltas = step_end - step_start
+    # Only need the actual time values in this (rarer) case
+    if climatology:
+        step_start = time.isel({time_dimension: slice(None, -1)})
+        step_end = time.isel({time_dimension: slice(1, None)})
+
+    # Subtract the underlying variables.
+    # This avoids xarray aligning the start and end on their time co-ordinates,
+    # which is unnecessary work for bounds and wrong for the shifted time values
+    # we use for climatologies.
+    time_deltas = xr.DataArray(step_end.variable - step_start.variable)
     if (time_deltas.dt.days == 1).all():
         return "day"
 
@@ -506,7 +665,11 @@ def infer_time_start_time_end_for_filename(
     elif is_climatology:
         # Can do this with confidence as this is what the spec defines.
         # See comments in `ds_is_climatology`.
-        climatology_bounds = get_climatology_bounds(ds, time_dimension=time_dimension)
+        # Load once up front so that the min and max calls below
+        # don't each trigger their own read/computation of lazy data.
+        climatology_bounds = get_climatology_bounds(
+            ds, time_dimension=time_dimension
+        ).compute()
 
         time_start = xr_time_min_max_to_single_value(climatology_bounds.min())
         time_end = xr_time_min_max_to_single_value(climatology_bounds.max())
@@ -520,8 +683,10 @@ def infer_time_start_time_end_for_filename(
                 time_end = time_end - dt.timedelta(days=1)
 
     else:
-        time_start = xr_time_min_max_to_single_value(ds[time_dimension].min())
-        time_end = xr_time_min_max_to_single_value(ds[time_dimension].max())
+        # As above, load once rather than once for each of min and max
+        time_values = ds[time_dimension].compute()
+        time_start = xr_time_min_max_to_single_value(time_values.min())
+        time_end = xr_time_min_max_to_single_value(time_values.max())
 
     return time_start, time_end
 
@@ -560,11 +725,12 @@ def create_time_range_for_filename(
         The time-range information,
         formatted correctly given the underlying dataset's frequency.
     """
-    fd = partial(format_date_for_time_range, ds_frequency=ds_frequency)
-    time_start_formatted = fd(time_start)
-    time_end_formatted = fd(time_end)
+    time_start_formatted = format_date_for_time_range(
+        time_start, ds_frequency=ds_frequency
+    )
+    time_end_formatted = format_date_for_time_range(time_end, ds_frequency=ds_frequency)
 
-    res = start_end_separator.join([time_start_formatted, time_end_formatted])
+    res = f"{time_start_formatted}{start_end_separator}{time_end_formatted}"
 
     if frequency_is_climatology(ds_frequency):
         res = f"{res}-clim"
@@ -572,56 +738,68 @@ def create_time_range_for_filename(
     return res
 
 
+GHG_SPECIES: tuple[str, ...] = (
+    "carbon_dioxide",
+    "methane",
+    "nitrous_oxide",
+    "pfc116",
+    "pfc218",
+    "pfc3110",
+    "pfc4112",
+    "pfc5114",
+    "pfc6116",
+    "pfc7118",
+    "pfc318",
+    "carbon_tetrachloride",
+    "carbon_tetrafluoride",
+    "cfc11",
+    "cfc113",
+    "cfc114",
+    "cfc115",
+    "cfc12",
+    "dichloromethane",
+    "methyl_bromide",
+    "hcc140a",
+    "methyl_chloride",
+    "chloroform",
+    "halon1211",
+    "halon1301",
+    "halon2402",
+    "hcfc141b",
+    "hcfc142b",
+    "hcfc22",
+    "hfc125",
+    "hfc134a",
+    "hfc143a",
+    "hfc152a",
+    "hfc227ea",
+    "hfc23",
+    "hfc236fa",
+    "hfc245fa",
+    "hfc32",
+    "hfc365mfc",
+    "hfc4310mee",
+    "nitrogen_trifluoride",
+    "sulfur_hexafluoride",
+    "sulfuryl_fluoride",
+    "cfc11_eq",
+    "cfc12_eq",
+    "hfc134a_eq",
+)
+"""
+Greenhouse gas species for which we know the dataset category and realm
+
+The variable name for each species is `f"mole_fraction_of_{species}_in_air"`.
+"""
+
 VARIABLE_DATASET_CATEGORY_MAP = {
     "tos": "SSTsAndSeaIce",
     "siconc": "SSTsAndSeaIce",
     "sftof": "SSTsAndSeaIce",
-    "mole_fraction_of_carbon_dioxide_in_air": "GHGConcentrations",
-    "mole_fraction_of_methane_in_air": "GHGConcentrations",
-    "mole_fraction_of_nitrous_oxide_in_air": "GHGConcentrations",
-    "mole_fraction_of_pfc116_in_air": "GHGConcentrations",
-    "mole_fraction_of_pfc218_in_air": "GHGConcentrations",
-    "mole_fraction_of_pfc3110_in_air": "GHGConcentrations",
-    "mole_fraction_of_pfc4112_in_air": "GHGConcentrations",
-    "mole_fraction_of_pfc5114_in_air": "GHGConcentrations",
-    "mole_fraction_of_pfc6116_in_air": "GHGConcentrations",
-    "mole_fraction_of_pfc7118_in_air": "GHGConcentrations",
-    "mole_fraction_of_pfc318_in_air": "GHGConcentrations",
-    "mole_fraction_of_carbon_tetrachloride_in_air": "GHGConcentrations",
-    "mole_fraction_of_carbon_tetrafluoride_in_air": "GHGConcentrations",
-    "mole_fraction_of_cfc11_in_air": "GHGConcentrations",
-    "mole_fraction_of_cfc113_in_air": "GHGConcentrations",
-    "mole_fraction_of_cfc114_in_air": "GHGConcentrations",
-    "mole_fraction_of_cfc115_in_air": "GHGConcentrations",
-    "mole_fraction_of_cfc12_in_air": "GHGConcentrations",
-    "mole_fraction_of_dichloromethane_in_air": "GHGConcentrations",
-    "mole_fraction_of_methyl_bromide_in_air": "GHGConcentrations",
-    "mole_fraction_of_hcc140a_in_air": "GHGConcentrations",
-    "mole_fraction_of_methyl_chloride_in_air": "GHGConcentrations",
-    "mole_fraction_of_chloroform_in_air": "GHGConcentrations",
-    "mole_fraction_of_halon1211_in_air": "GHGConcentrations",
-    "mole_fraction_of_halon1301_in_air": "GHGConcentrations",
-    "mole_fraction_of_halon2402_in_air": "GHGConcentrations",
-    "mole_fraction_of_hcfc141b_in_air": "GHGConcentrations",
-    "mole_fraction_of_hcfc142b_in_air": "GHGConcentrations",
-    "mole_fraction_of_hcfc22_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc125_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc134a_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc143a_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc152a_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc227ea_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc23_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc236fa_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc245fa_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc32_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc365mfc_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc4310mee_in_air": "GHGConcentrations",
-    "mole_fraction_of_nitrogen_trifluoride_in_air": "GHGConcentrations",
-    "mole_fraction_of_sulfur_hexafluoride_in_air": "GHGConcentrations",
-    "mole_fraction_of_sulfuryl_fluoride_in_air": "GHGConcentrations",
-    "mole_fraction_of_cfc11_eq_in_air": "GHGConcentrations",
-    "mole_fraction_of_cfc12_eq_in_air": "GHGConcentrations",
-    "mole_fraction_of_hfc134a_eq_in_air": "GHGConcentrations",
+    **{
+        f"mole_fraction_of_{species}_in_air": "GHGConcentrations"
+        for species in GHG_SPECIES
+    },
     "solar_irradiance_per_unit_wavelength": "solar",
     "solar_irradiance": "solar",
 }
@@ -641,52 +819,7 @@ VARIABLE_REALM_MAP = {
     "siconc": "seaIce",
     "sftof": "ocean",
     "areacello": "ocean",
-    "mole_fraction_of_carbon_dioxide_in_air": "atmos",
-    "mole_fraction_of_methane_in_air": "atmos",
-    "mole_fraction_of_nitrous_oxide_in_air": "atmos",
-    "mole_fraction_of_pfc116_in_air": "atmos",
-    "mole_fraction_of_pfc218_in_air": "atmos",
-    "mole_fraction_of_pfc3110_in_air": "atmos",
-    "mole_fraction_of_pfc4112_in_air": "atmos",
-    "mole_fraction_of_pfc5114_in_air": "atmos",
-    "mole_fraction_of_pfc6116_in_air": "atmos",
-    "mole_fraction_of_pfc7118_in_air": "atmos",
-    "mole_fraction_of_pfc318_in_air": "atmos",
-    "mole_fraction_of_carbon_tetrachloride_in_air": "atmos",
-    "mole_fraction_of_carbon_tetrafluoride_in_air": "atmos",
-    "mole_fraction_of_cfc11_in_air": "atmos",
-    "mole_fraction_of_cfc113_in_air": "atmos",
-    "mole_fraction_of_cfc114_in_air": "atmos",
-    "mole_fraction_of_cfc115_in_air": "atmos",
-    "mole_fraction_of_cfc12_in_air": "atmos",
-    "mole_fraction_of_dichloromethane_in_air": "atmos",
-    "mole_fraction_of_methyl_bromide_in_air": "atmos",
-    "mole_fraction_of_hcc140a_in_air": "atmos",
-    "mole_fraction_of_methyl_chloride_in_air": "atmos",
-    "mole_fraction_of_chloroform_in_air": "atmos",
-    "mole_fraction_of_halon1211_in_air": "atmos",
-    "mole_fraction_of_halon1301_in_air": "atmos",
-    "mole_fraction_of_halon2402_in_air": "atmos",
-    "mole_fraction_of_hcfc141b_in_air": "atmos",
-    "mole_fraction_of_hcfc142b_in_air": "atmos",
-    "mole_fraction_of_hcfc22_in_air": "atmos",
-    "mole_fraction_of_hfc125_in_air": "atmos",
-    "mole_fraction_of_hfc134a_in_air": "atmos",
-    "mole_fraction_of_hfc143a_in_air": "atmos",
-    "mole_fraction_of_hfc152a_in_air": "atmos",
-    "mole_fraction_of_hfc227ea_in_air": "atmos",
-    "mole_fraction_of_hfc23_in_air": "atmos",
-    "mole_fraction_of_hfc236fa_in_air": "atmos",
-    "mole_fraction_of_hfc245fa_in_air": "atmos",
-    "mole_fraction_of_hfc32_in_air": "atmos",
-    "mole_fraction_of_hfc365mfc_in_air": "atmos",
-    "mole_fraction_of_hfc4310mee_in_air": "atmos",
-    "mole_fraction_of_nitrogen_trifluoride_in_air": "atmos",
-    "mole_fraction_of_sulfur_hexafluoride_in_air": "atmos",
-    "mole_fraction_of_sulfuryl_fluoride_in_air": "atmos",
-    "mole_fraction_of_cfc11_eq_in_air": "atmos",
-    "mole_fraction_of_cfc12_eq_in_air": "atmos",
-    "mole_fraction_of_hfc134a_eq_in_air": "atmos",
+    **{f"mole_fraction_of_{species}_in_air": "atmos" for species in GHG_SPECIES},
     "solar_irradiance_per_unit_wavelength": "atmos",
     "solar_irradiance": "atmos",
     "areacella": "atmos",
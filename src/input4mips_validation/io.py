@@ -4,7 +4,7 @@ Input/output of data to/from disk
 
 from __future__ import annotations
 
-import datetime as dt
+import time
 import uuid
 from pathlib import Path
 from typing import Any
@@ -37,6 +37,7 @@ def prepare_out_path_and_cubes(  # noqa: PLR0913
     xr_variable_processor: XRVariableProcessorLike = XRVariableHelper(),
     frequency_metadata_keys: FrequencyMetadataKeys = FrequencyMetadataKeys(),
     bounds_info: BoundsInfo = BoundsInfo(),
+    validate: bool = True,
 ) -> iris.cube.CubeList:
     """
     Prepare a path and [iris.cube.Cube][]'s for writing to disk
@@ -71,6 +72,13 @@ def prepare_out_path_and_cubes(  # noqa: PLR0913
     bounds_info
         Metadata definitions for bounds handling
 
+    validate
+        Should `ds` be validated before being converted?
+
+        Only set this to `False` if you have already validated `ds`
+        (e.g. with
+        [`get_ds_to_write_to_disk_validation_result`][input4mips_validation.validation.datasets_to_write_to_disk.get_ds_to_write_to_disk_validation_result]).
+
     Returns
     -------
     :
@@ -79,19 +87,20 @@ def prepare_out_path_and_cubes(  # noqa: PLR0913
     See Also
     --------
     [input4mips_validation.io.write_ds_to_disk][].
-    """
-    # As part of https://github.com/climate-resource/input4mips_validation/issues/14
-    # add final validation here for bullet proofness
-    # - tracking ID, creation date, comparison with DRS from cvs etc.
-    validation_result = get_ds_to_write_to_disk_validation_result(
-        ds=ds,
-        out_path=out_path,
-        cvs=cvs,
-        xr_variable_processor=xr_variable_processor,
-        frequency_metadata_keys=frequency_metadata_keys,
-        bounds_info=bounds_info,
-    )
-    validation_result.raise_if_errors()
+    """  # noqa: E501
+    if validate:
+        # As part of https://github.com/climate-resource/input4mips_validation/issues/14
+        # add final validation here for bullet proofness
+        # - tracking ID, creation date, comparison with DRS from cvs etc.
+        validation_result = get_ds_to_write_to_disk_validation_result(
+            ds=ds,
+            out_path=out_path,
+            cvs=cvs,
+            xr_variable_processor=xr_variable_processor,
+            frequency_metadata_keys=frequency_metadata_keys,
+            bounds_info=bounds_info,
+        )
+        validation_result.raise_if_errors()
 
     # Having validated, make the target directory and write
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -103,7 +112,11 @@ def prepare_out_path_and_cubes(  # noqa: PLR0913
 
 
 def write_ds_to_disk(
-    ds: xr.Dataset, out_path: Path, cvs: Input4MIPsCVs, **kwargs: Any
+    ds: xr.Dataset,
+    out_path: Path,
+    cvs: Input4MIPsCVs,
+    validate: bool = True,
+    **kwargs: Any,
 ) -> Path:
     """
     Write a dataset to disk
@@ -125,6 +138,11 @@ def write_ds_to_disk(
     cvs
         CVs to use to validate the dataset before writing
 
+    validate
+        Should `ds` be validated before being written?
+
+        Passed to [input4mips_validation.io.prepare_out_path_and_cubes][].
+
     **kwargs
         Passed through to [iris.save][]
 
@@ -138,7 +156,9 @@ def write_ds_to_disk(
     [input4mips_validation.io.prepare_out_path_and_cubes][].
     [iris.save][].
     """
-    cubes = prepare_out_path_and_cubes(ds=ds, out_path=out_path, cvs=cvs)
+    cubes = prepare_out_path_and_cubes(
+        ds=ds, out_path=out_path, cvs=cvs, validate=validate
+    )
     iris.save(cubes, out_path, **kwargs)
 
     return out_path
@@ -154,7 +174,7 @@ def generate_tracking_id() -> str:
         Tracking ID
     """
     # TODO: ask Paul what this hdl business is about
-    return "hdl:21.14100/" + str(uuid.uuid4())
+    return f"hdl:21.14100/{uuid.uuid4()}"
 
 
 def generate_creation_timestamp() -> str:
@@ -166,8 +186,7 @@ def generate_creation_timestamp() -> str:
     :
         Creation timestamp
     """
-    ts = dt.datetime.now(dt.timezone.utc).replace(
-        microsecond=0  # remove microseconds from creation_timestamp
-    )
-
-    return ts.strftime(CREATION_DATE_FORMAT)
+    # `time.gmtime` gives the current time in UTC, to the second,
+    # which is exactly what `CREATION_DATE_FORMAT` needs,
+    # without having to create (timezone-aware) datetime objects.
+    return time.strftime(CREATION_DATE_FORMAT, time.gmtime())
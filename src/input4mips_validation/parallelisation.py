@@ -6,11 +6,13 @@ This always feels so much harder than it should be
 
 from __future__ import annotations
 
+import collections
 import concurrent.futures
+import itertools
 import multiprocessing
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sized
 from multiprocessing.context import BaseContext
-from typing import Callable, TypeVar
+from typing import Any, Callable, TypeVar
 
 import tqdm
 from loguru import logger
@@ -20,6 +22,211 @@ P = ParamSpec("P")
 T = TypeVar("T")
 U = TypeVar("U")
 
+CHUNKS_PER_PROCESS: int = 4
+"""
+Number of chunks to (aim to) send to each process when running in parallel
+
+Sending items in chunks, rather than one by one,
+reduces the inter-process communication overhead.
+Sending more than one chunk to each process
+means that work is still shared reasonably evenly
+if some items take longer to process than others.
+"""
+
+MAX_EXTRA_CHUNKS_IN_FLIGHT: int = 8
+"""
+Maximum number of chunks to queue, beyond one per process
+
+Chunks are only submitted to the processes as earlier chunks finish.
+This keeps memory use proportional to the number of processes,
+rather than to the number of items being processed.
+"""
+
+
+def call_with_args_chunk(
+    chunk: list[U],
+    func_to_call: Callable[..., T],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> list[T]:
+    """
+    Call a function with each input in a chunk, followed by fixed arguments
+
+    This is a helper for [`run_parallel`][input4mips_validation.parallelisation.run_parallel].
+
+    Parameters
+    ----------
+    chunk
+        Inputs (each is passed as the first positional argument)
+
+    func_to_call
+        Function to call
+
+    args
+        Other positional arguments
+
+    kwargs
+        Keyword arguments
+
+    Returns
+    -------
+    :
+        Result of each call
+    """  # noqa: E501
+    return [func_to_call(inv, *args, **kwargs) for inv in chunk]
+
+
+def iter_chunks(iterable: Iterable[U], chunksize: int) -> Iterator[list[U]]:
+    """
+    Iterate over an iterable in chunks
+
+    Parameters
+    ----------
+    iterable
+        Iterable to chunk
+
+    chunksize
+        Size of each chunk (the last chunk may be smaller)
+
+    Yields
+    ------
+    :
+        Chunks of `iterable`
+    """
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, chunksize)):
+        yield chunk
+
+
+def get_chunksize(n_items: int, n_processes: int) -> int:
+    """
+    Get the chunk size to use when sending items to processes
+
+    Parameters
+    ----------
+    n_items
+        Number of items to process
+
+    n_processes
+        Number of processes
+
+    Returns
+    -------
+    :
+        Chunk size (always at least one)
+    """
+    return max(1, n_items // (n_processes * CHUNKS_PER_PROCESS))
+
+
+def run_parallel_iter(
+    func_to_call: Callable[Concatenate[U, P], T],
+    iterable_input: Iterable[U],
+    input_desc: str,
+    n_processes: int,
+    mp_context: BaseContext | None = multiprocessing.get_context("fork"),
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Iterator[T]:
+    """
+    Run a function in parallel, yielding the results as they become available
+
+    Only a bounded number of results are held in memory at any one time
+    (see [`MAX_EXTRA_CHUNKS_IN_FLIGHT`][input4mips_validation.parallelisation.MAX_EXTRA_CHUNKS_IN_FLIGHT]).
+    Hence this is a better choice than
+    [`run_parallel`][input4mips_validation.parallelisation.run_parallel]
+    if you process each result as it arrives and the results are large.
+
+    Parameters
+    ----------
+    func_to_call
+        Function to call
+
+    iterable_input
+        Input with which to call the function.
+
+    input_desc
+        Description of the input (used to make the progress bars more helpful)
+
+    n_processes
+        Number of processes to use during the processing.
+
+        For full details, see
+        [`run_parallel`][input4mips_validation.parallelisation.run_parallel].
+
+    mp_context
+        Multiprocessing context to use.
+
+        For full details, see
+        [`run_parallel`][input4mips_validation.parallelisation.run_parallel].
+
+    *args
+        Arguments to use for every call of `func_to_call`.
+
+    **kwargs
+        Keyword arguments to use for every call of `func_to_call`.
+
+    Yields
+    ------
+    :
+        Result of calling `func_to_call` with each element in `iterable_input`
+        in combination with `args` and `kwargs`.
+
+        The results are yielded in the same order as `iterable_input`.
+    """  # noqa: E501
+    if n_processes == 1:
+        logger.debug("Running serially")
+        for inv in tqdm.tqdm(iterable_input, desc=input_desc):
+            yield func_to_call(inv, *args, **kwargs)
+
+        return
+
+    if mp_context is None:
+        mp_context = multiprocessing.get_context("fork")
+
+    # If we don't know how many items there are,
+    # we can't choose a chunk size so fall back to one item per chunk.
+    n_items = len(iterable_input) if isinstance(iterable_input, Sized) else None
+    chunksize = (
+        1
+        if n_items is None
+        else get_chunksize(n_items=n_items, n_processes=n_processes)
+    )
+    max_chunks_in_flight = n_processes + MAX_EXTRA_CHUNKS_IN_FLIGHT
+    logger.info(
+        f"Submitting {input_desc} to {n_processes} parallel processes "
+        f"in chunks of {chunksize}"
+    )
+
+    # Futures, in the order in which they were submitted
+    in_flight: collections.deque[concurrent.futures.Future[list[T]]] = (
+        collections.deque()
+    )
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=n_processes, mp_context=mp_context
+    ) as executor, tqdm.tqdm(
+        # Results arrive a chunk at a time,
+        # so smooth the rate over more updates than tqdm's default.
+        desc=input_desc,
+        total=n_items,
+        smoothing=0.05,
+    ) as pbar:
+        for chunk in iter_chunks(iterable_input, chunksize):
+            if len(in_flight) >= max_chunks_in_flight:
+                # Wait for the oldest chunk.
+                # The other chunks in flight keep being processed meanwhile.
+                chunk_res = in_flight.popleft().result()
+                pbar.update(len(chunk_res))
+                yield from chunk_res
+
+            in_flight.append(
+                executor.submit(call_with_args_chunk, chunk, func_to_call, args, kwargs)
+            )
+
+        while in_flight:
+            chunk_res = in_flight.popleft().result()
+            pbar.update(len(chunk_res))
+            yield from chunk_res
+
 
 def run_parallel(
     func_to_call: Callable[Concatenate[U, P], T],
@@ -79,41 +286,22 @@ def run_parallel(
     :
         Result of calling `func_to_call` with every element in `iterable_input`
         in combination with `args` and `kwargs`.
+
+        The results are in the same order as `iterable_input`.
+
+    See Also
+    --------
+    [`run_parallel_iter`][input4mips_validation.parallelisation.run_parallel_iter],
+    which yields the results rather than collecting them all.
     """
-    if n_processes == 1:
-        logger.debug("Running serially")
-        res = [
-            func_to_call(inv, *args, **kwargs)
-            for inv in tqdm.tqdm(iterable_input, desc=input_desc)
-        ]
-
-    else:
-        if mp_context is None:
-            mp_context = multiprocessing.get_context("fork")
-
-        logger.info(f"Submitting {input_desc} to {n_processes} parallel processes")
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=n_processes, mp_context=mp_context
-        ) as executor:
-            futures = [
-                executor.submit(
-                    func_to_call,
-                    inv,
-                    *args,
-                    **kwargs,
-                )
-                for inv in tqdm.tqdm(
-                    iterable_input, desc=f"Submitting {input_desc} to queue"
-                )
-            ]
-
-            res = [
-                future.result()
-                for future in tqdm.tqdm(
-                    concurrent.futures.as_completed(futures),
-                    desc="Retrieving parallel results",
-                    total=len(futures),
-                )
-            ]
-
-    return tuple(res)
+    return tuple(
+        run_parallel_iter(
+            func_to_call,
+            iterable_input,
+            input_desc,
+            n_processes,
+            mp_context,
+            *args,
+            **kwargs,
+        )
+    )
@@ -7,6 +7,7 @@ and generation of test/example instances.
 
 from __future__ import annotations
 
+import concurrent.futures
 import os
 from collections.abc import Collection
 from functools import partial
@@ -28,12 +29,20 @@ from input4mips_validation.dataset.dataset import (
 )
 from input4mips_validation.hashing import get_file_hash_sha256
 
+EXAMPLE_DATA_SEED: int = 0
+"""
+Seed used to generate example data if no random number generator is supplied
+
+This makes the example data reproducible.
+"""
+
 
 def get_valid_ds_min_metadata_example(
     variable_id: str = "siconc",
     units: str = "%",
     unit_registry: Union[pint.registry.UnitRegistry, None] = None,
     fixed_field: bool = False,
+    rng: Union[np.random.Generator, None] = None,
 ) -> tuple[xr.Dataset, Input4MIPsDatasetMetadataDataProducerMinimum]:
     """
     Get an example of a valid dataset and associated minimum metadata
@@ -57,6 +66,12 @@ def get_valid_ds_min_metadata_example(
     fixed_field
         Should we return a fixed field dataset?
 
+    rng
+        Random number generator to use to generate the data.
+        If not supplied, we create one with
+        [numpy.random.default_rng][], seeded with
+        [`EXAMPLE_DATA_SEED`][input4mips_validation.testing.EXAMPLE_DATA_SEED].
+
     Returns
     -------
     dataset :
@@ -67,6 +82,8 @@ def get_valid_ds_min_metadata_example(
     """
     if unit_registry is None:
         ur: pint.registry.UnitRegistry = pint.get_application_registry()  # type: ignore
+    else:
+        ur = unit_registry
 
     metadata_minimum = Input4MIPsDatasetMetadataDataProducerMinimum(
         grid_label="gn",
@@ -78,13 +95,13 @@ def get_valid_ds_min_metadata_example(
     lon = np.arange(-165.0, 180.0, 15.0, dtype=np.float64)
     lat = np.arange(-82.5, 90.0, 15.0, dtype=np.float64)
 
-    rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng(seed=EXAMPLE_DATA_SEED)
     if not fixed_field:
-        time = [
-            cftime.datetime(y, m, 1)
-            for y in range(2000, 2010 + 1)
-            for m in range(1, 13)
-        ]
+        # Monthly, from 2000-01 to 2010-12
+        time = xr.date_range(
+            start="2000-01-01", periods=11 * 12, freq="MS", use_cftime=True
+        )
 
         ds_data = ur.Quantity(
             rng.random((lat.size, lon.size, len(time))),
@@ -123,6 +140,7 @@ def get_valid_ds_min_metadata_example_climatology(
     variable_id: str = "co2",
     units: str = "ppm",
     unit_registry: Union[pint.registry.UnitRegistry, None] = None,
+    rng: Union[np.random.Generator, None] = None,
 ) -> tuple[xr.Dataset, Input4MIPsDatasetMetadataDataProducerMinimum]:
     """
     Get an example of a valid climatology dataset and associated minimum metadata
@@ -143,6 +161,12 @@ def get_valid_ds_min_metadata_example_climatology(
         If not supplied, we retrieve it with
         [pint.get_application_registry][].
 
+    rng
+        Random number generator to use to generate the data.
+        If not supplied, we create one with
+        [numpy.random.default_rng][], seeded with
+        [`EXAMPLE_DATA_SEED`][input4mips_validation.testing.EXAMPLE_DATA_SEED].
+
     Returns
     -------
     dataset :
@@ -153,6 +177,8 @@ def get_valid_ds_min_metadata_example_climatology(
     """
     if unit_registry is None:
         ur: pint.registry.UnitRegistry = pint.get_application_registry()  # type: ignore
+    else:
+        ur = unit_registry
 
     metadata_minimum = Input4MIPsDatasetMetadataDataProducerMinimum(
         grid_label="gn",
@@ -164,7 +190,8 @@ def get_valid_ds_min_metadata_example_climatology(
     lon = np.arange(-165.0, 180.0, 15.0, dtype=np.float64)
     lat = np.arange(-82.5, 90.0, 15.0, dtype=np.float64)
 
-    rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng(seed=EXAMPLE_DATA_SEED)
 
     time = [cftime.datetime(2000, m, 1) for m in range(1, 13)]
     climatology_bounds = []
@@ -323,10 +350,18 @@ def create_files_in_tree(  # noqa: PLR0913
     if len(variable_ids) != len(fixed_fields):
         raise AssertionError
 
+    # Retrieve these once, rather than for every file
+    unit_registry: pint.registry.UnitRegistry = pint.get_application_registry()  # type: ignore
+    rng = np.random.default_rng(seed=EXAMPLE_DATA_SEED)
+
     written_files = []
     for variable_id, units, fixed_field in zip(variable_ids, units, fixed_fields):
         ds, metadata_minimum = get_valid_ds_min_metadata_example(
-            variable_id=variable_id, units=units, fixed_field=fixed_field
+            variable_id=variable_id,
+            units=units,
+            fixed_field=fixed_field,
+            unit_registry=unit_registry,
+            rng=rng,
         )
         if "time" in ds:
             ds["time"].encoding = {
@@ -356,6 +391,50 @@ def create_files_in_tree(  # noqa: PLR0913
     return written_files
 
 
+MAX_THREADS_FILE_HASHING: int = 8
+"""
+Maximum number of threads to use when hashing written files
+"""
+
+
+def get_written_file_info(
+    written_file: Path, tree_root: Path
+) -> tuple[str, dict[str, str]]:
+    """
+    Get information about a written file that is useful for testing
+
+    This doesn't include the file's hash,
+    which is much slower to calculate than the rest of the information
+    (see [`create_files_in_tree_return_info`][input4mips_validation.testing.create_files_in_tree_return_info]).
+
+    Parameters
+    ----------
+    written_file
+        File to get information about
+
+    tree_root
+        Root of the tree in which the file was written
+
+    Returns
+    -------
+    variable_id :
+        Variable ID of the file
+
+    info :
+        Information about the file
+    """  # noqa: E501
+    with xr.open_dataset(written_file, decode_cf=False) as ds:
+        variable_id = ds.attrs["variable_id"]
+        info = {k: ds.attrs[k] for k in ["creation_date", "tracking_id"]}
+
+    info["filepath"] = str(written_file)
+    info["esgf_dataset_master_id"] = str(
+        written_file.relative_to(tree_root).parent
+    ).replace(os.sep, ".")
+
+    return variable_id, info
+
+
 def create_files_in_tree_return_info(
     tree_root: Path, **kwargs: Any
 ) -> dict[str, dict[str, str]]:
@@ -377,16 +456,23 @@ def create_files_in_tree_return_info(
         Information about the files useful for testing
     """
     written_files = create_files_in_tree(tree_root=tree_root, **kwargs)
-    info = {}
-    for written_file in written_files:
-        ds = xr.open_dataset(written_file, decode_cf=False)
-
-        variable_id = ds.attrs["variable_id"]
-        info[variable_id] = {k: ds.attrs[k] for k in ["creation_date", "tracking_id"]}
-        info[variable_id]["sha256"] = get_file_hash_sha256(written_file)
-        info[variable_id]["filepath"] = str(written_file)
-        info[variable_id]["esgf_dataset_master_id"] = str(
-            written_file.relative_to(tree_root).parent
-        ).replace(os.sep, ".")
-
-    return info
+    if not written_files:
+        return {}
+
+    # netCDF/HDF5 isn't thread-safe, so read the headers one file at a time
+    files_info = [
+        get_written_file_info(written_file, tree_root=tree_root)
+        for written_file in written_files
+    ]
+
+    # Hashing is plain file I/O (and hashlib releases the GIL while hashing),
+    # so overlap the hashing of the different files.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(MAX_THREADS_FILE_HASHING, len(written_files))
+    ) as executor:
+        for (_, info), sha256 in zip(
+            files_info, executor.map(get_file_hash_sha256, written_files)
+        ):
+            info["sha256"] = sha256
+
+    return dict(files_info)
@@ -8,8 +8,14 @@ Bugs are likely :)
 
 from __future__ import annotations
 
+import atexit
 import concurrent.futures
 import ftplib
+import os
+import posixpath
+import socket
+import threading
+import weakref
 from collections.abc import Iterable, Iterator
 from contextlib import AbstractContextManager, contextmanager
 from functools import partial
@@ -18,11 +24,11 @@ from types import TracebackType
 from typing import Callable, Optional, Protocol
 
 import tqdm
-import tqdm.utils
 from loguru import logger
 from typing_extensions import TypeAlias
 
 from input4mips_validation.cvs import Input4MIPsCVs
+from input4mips_validation.file_search import iter_files_in_tree
 from input4mips_validation.logging import LOG_LEVEL_INFO_FILE
 
 GetFTPConnection: TypeAlias = Callable[[], AbstractContextManager[Optional[ftplib.FTP]]]
@@ -30,6 +36,342 @@ GetFTPConnection: TypeAlias = Callable[[], AbstractContextManager[Optional[ftpli
 Type hint for callables that we can use for managing FTP connections
 """
 
+UPLOAD_BLOCKSIZE: int = 2**20
+"""
+Size of the blocks (in bytes) in which files are sent to the FTP server
+
+This is much bigger than [ftplib][]'s default (8 KiB)
+so that each call to `send` can fill the TCP window,
+even on high-latency connections.
+"""
+
+_KNOWN_FTP_DIRS: weakref.WeakKeyDictionary[ftplib.FTP, set[str]] = (
+    weakref.WeakKeyDictionary()
+)
+_KNOWN_FTP_DIRS_LOCK = threading.Lock()
+
+
+def get_known_ftp_dirs(ftp: ftplib.FTP) -> set[str]:
+    """
+    Get the directories that we know exist on the server for a given connection
+
+    These are directories that we have already made (or found)
+    using this connection.
+    Hence we can change directly into them,
+    rather than having to make and change into each parent in turn.
+
+    Parameters
+    ----------
+    ftp
+        FTP connection
+
+    Returns
+    -------
+    :
+        Absolute paths of the directories we know exist on the server.
+
+        This is the set that is stored for `ftp`,
+        so updates to it will be seen by later calls.
+    """
+    with _KNOWN_FTP_DIRS_LOCK:
+        return _KNOWN_FTP_DIRS.setdefault(ftp, set())
+
+
+_FTP_CWDS: weakref.WeakKeyDictionary[ftplib.FTP, str] = weakref.WeakKeyDictionary()
+_FTP_CWDS_LOCK = threading.Lock()
+
+
+def get_ftp_cwd(ftp: ftplib.FTP) -> Optional[str]:
+    """
+    Get the current directory of an FTP connection, as tracked on our side
+
+    The directory is tracked by [`cd_v`][input4mips_validation.upload_ftp.cd_v],
+    so this doesn't require a round trip to the server.
+
+    Parameters
+    ----------
+    ftp
+        FTP connection
+
+    Returns
+    -------
+    :
+        Current directory.
+
+        If we don't know the current directory, `None`.
+    """
+    with _FTP_CWDS_LOCK:
+        return _FTP_CWDS.get(ftp)
+
+
+_FTP_LOGIN_DIRS: weakref.WeakKeyDictionary[ftplib.FTP, str] = (
+    weakref.WeakKeyDictionary()
+)
+_FTP_LOGIN_DIRS_LOCK = threading.Lock()
+
+
+def get_ftp_login_dir(ftp: ftplib.FTP) -> str:
+    """
+    Get the directory an FTP connection started in
+
+    The server is only asked (with `PWD`) the first time this is called
+    for each connection, so it must first be called
+    before the connection changes directory.
+    [`upload_file`][input4mips_validation.upload_ftp.upload_file]
+    does this before it changes directory for the first time.
+
+    Parameters
+    ----------
+    ftp
+        FTP connection
+
+    Returns
+    -------
+    :
+        Absolute path of the directory the connection started in.
+
+        Relative paths on the server are resolved relative to this directory.
+    """
+    with _FTP_LOGIN_DIRS_LOCK:
+        if ftp not in _FTP_LOGIN_DIRS:
+            _FTP_LOGIN_DIRS[ftp] = ftp.pwd()
+
+        return _FTP_LOGIN_DIRS[ftp]
+
+
+def forget_ftp_state(ftp: ftplib.FTP) -> None:
+    """
+    Forget everything we have tracked on our side about an FTP connection
+
+    This clears the directories we know exist
+    (see [`get_known_ftp_dirs`][input4mips_validation.upload_ftp.get_known_ftp_dirs])
+    and the current directory
+    (see [`get_ftp_cwd`][input4mips_validation.upload_ftp.get_ftp_cwd]).
+    Use this when the tracked state may no longer be true,
+    e.g. because the connection is being re-used for a different upload
+    and the server may have changed in the meantime.
+
+    The directory the connection started in
+    (see [`get_ftp_login_dir`][input4mips_validation.upload_ftp.get_ftp_login_dir])
+    is kept, as it doesn't change over the life of the connection.
+
+    Parameters
+    ----------
+    ftp
+        FTP connection
+    """  # noqa: E501
+    with _KNOWN_FTP_DIRS_LOCK:
+        _KNOWN_FTP_DIRS.pop(ftp, None)
+
+    with _FTP_CWDS_LOCK:
+        _FTP_CWDS.pop(ftp, None)
+
+
+MAX_IDLE_FTP_CONNECTIONS: int = 8
+"""
+Default maximum number of idle connections to keep per server and username
+"""
+
+
+class FTPConnectionPool:
+    """
+    Pool of FTP connections
+
+    Logging in to an FTP server requires several round trips.
+    Connections are returned to the pool once they are no longer needed,
+    so repeated uploads to the same server (e.g. repeated calls to
+    [`upload_ftp`][input4mips_validation.upload_ftp.upload_ftp])
+    can re-use them rather than logging in again.
+    """
+
+    def __init__(self, max_idle_connections: int = MAX_IDLE_FTP_CONNECTIONS) -> None:
+        """
+        Initialise
+
+        Parameters
+        ----------
+        max_idle_connections
+            Maximum number of idle connections to keep per server and username.
+
+            Connections returned to the pool beyond this are closed.
+        """
+        self.max_idle_connections = max_idle_connections
+        self._idle: dict[tuple[str, str], list[ftplib.FTP]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(
+        self, ftp_server: str, username: str, password: str
+    ) -> Iterator[ftplib.FTP]:
+        """
+        Get a connection to an FTP server
+
+        When the context block is exited, the connection is returned to the pool.
+        If an error is raised within the context block,
+        the connection is closed instead
+        (as it may be in an unknown state).
+
+        Anything tracked on our side about the connection
+        (known directories, current directory) is forgotten
+        when it is acquired and when it is released,
+        so nothing carries over between uses of a pooled connection.
+
+        Parameters
+        ----------
+        ftp_server
+            FTP server to login to
+
+        username
+            Username
+
+        password
+            Password
+
+        Yields
+        ------
+        :
+            Connection to the FTP server.
+        """
+        ftp = self.get_idle_connection(ftp_server=ftp_server, username=username)
+        if ftp is None:
+            ftp = ftplib.FTP(ftp_server, passwd=password, user=username)  # noqa: S321
+            logger.debug(f"Logged into {ftp_server} using {username=}")
+            # The control connection sits idle while (potentially large) files
+            # are transferred over the data connection.
+            # Keepalive stops firewalls and NAT from silently dropping it.
+            if ftp.sock is not None:
+                ftp.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        forget_ftp_state(ftp)
+
+        try:
+            yield ftp
+
+        except BaseException:
+            close_ftp_connection(ftp)
+            raise
+
+        self.release(ftp_server=ftp_server, username=username, ftp=ftp)
+
+    def get_idle_connection(
+        self, ftp_server: str, username: str
+    ) -> Optional[ftplib.FTP]:
+        """
+        Get an idle connection from the pool
+
+        Connections which are no longer alive are closed and discarded.
+        So are connections whose replies are out of sync with our commands
+        (e.g. after an aborted transfer),
+        which we detect by checking for the exact reply to `NOOP`.
+
+        Parameters
+        ----------
+        ftp_server
+            FTP server
+
+        username
+            Username
+
+        Returns
+        -------
+        :
+            Idle connection.
+
+            If there is no idle, live connection in the pool, `None`.
+        """
+        while True:
+            with self._lock:
+                idle = self._idle.get((ftp_server, username))
+                if not idle:
+                    return None
+
+                ftp = idle.pop()
+
+            try:
+                # voidcmd would accept any 2xx reply,
+                # including a stale one left over from an earlier transfer.
+                resp = ftp.sendcmd("NOOP")
+            except (OSError, EOFError, ftplib.Error):
+                logger.debug(f"Discarding dead connection to {ftp_server}")
+                close_ftp_connection(ftp)
+                continue
+
+            if not resp.startswith("200"):
+                logger.debug(
+                    f"Discarding out of sync connection to {ftp_server} "
+                    f"(reply to NOOP: {resp!r})"
+                )
+                close_ftp_connection(ftp)
+                continue
+
+            logger.debug(f"Re-using connection to {ftp_server} for {username=}")
+
+            return ftp
+
+    def release(self, ftp_server: str, username: str, ftp: ftplib.FTP) -> None:
+        """
+        Return a connection to the pool
+
+        Parameters
+        ----------
+        ftp_server
+            FTP server to which `ftp` is connected
+
+        username
+            Username with which `ftp` is logged in
+
+        ftp
+            Connection to return
+        """
+        forget_ftp_state(ftp)
+
+        with self._lock:
+            idle = self._idle.setdefault((ftp_server, username), [])
+            if len(idle) < self.max_idle_connections:
+                idle.append(ftp)
+                return
+
+        close_ftp_connection(ftp)
+
+    def close_all(self) -> None:
+        """
+        Close all the idle connections in the pool
+        """
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+
+        for connections in idle.values():
+            for ftp in connections:
+                close_ftp_connection(ftp)
+
+
+def close_ftp_connection(ftp: ftplib.FTP) -> None:
+    """
+    Close an FTP connection
+
+    If the connection can't be closed politely,
+    it is closed from our side without telling the server.
+
+    Parameters
+    ----------
+    ftp
+        FTP connection to close
+    """
+    try:
+        ftp.quit()
+    except (OSError, EOFError, ftplib.Error):
+        ftp.close()
+
+    logger.debug(f"Closed connection to {ftp.host}")
+
+
+FTP_CONNECTION_POOL = FTPConnectionPool()
+"""
+Pool of FTP connections used by [`login_to_ftp`][input4mips_validation.upload_ftp.login_to_ftp]
+"""  # noqa: E501
+atexit.register(FTP_CONNECTION_POOL.close_all)
+
 
 @contextmanager
 def login_to_ftp(
@@ -38,7 +380,10 @@ def login_to_ftp(
     """
     Create a connection to an FTP server.
 
-    When the context block is excited, the connection is closed.
+    Connections are taken from (and, when the context block is exited,
+    returned to)
+    [`FTP_CONNECTION_POOL`][input4mips_validation.upload_ftp.FTP_CONNECTION_POOL],
+    so we only log in again if there is no idle connection we can re-use.
 
     If we are doing a dry run, `None` is returned instead
     to signal that no connection was actually made.
@@ -69,22 +414,14 @@ def login_to_ftp(
     """
     if dry_run:
         logger.debug(f"Dry run. Would log in to {ftp_server} using {username=}")
-        ftp = None
-
-    else:
-        ftp = ftplib.FTP(ftp_server, passwd=password, user=username)  # noqa: S321
-        logger.debug(f"Logged into {ftp_server} using {username=}")
-
-    yield ftp
-
-    if ftp is None:
-        if not dry_run:  # pragma: no cover
-            raise AssertionError
+        yield None
         logger.debug(f"Dry run. Would close connection to {ftp_server}")
+        return
 
-    else:
-        ftp.quit()
-        logger.debug(f"Closed connection to {ftp_server}")
+    with FTP_CONNECTION_POOL.acquire(
+        ftp_server=ftp_server, username=username, password=password
+    ) as ftp:
+        yield ftp
 
 
 def cd_v(dir_to_move_to: str, ftp: ftplib.FTP) -> ftplib.FTP:
@@ -105,7 +442,27 @@ def cd_v(dir_to_move_to: str, ftp: ftplib.FTP) -> ftplib.FTP:
         The FTP connection
     """
     ftp.cwd(dir_to_move_to)
-    logger.debug(f"Now in {ftp.pwd()} on FTP server")
+
+    # Track the current directory on our side,
+    # rather than asking the server with a round trip after every change.
+    with _FTP_CWDS_LOCK:
+        if posixpath.isabs(dir_to_move_to):
+            _FTP_CWDS[ftp] = posixpath.normpath(dir_to_move_to)
+
+        elif ftp in _FTP_CWDS:
+            _FTP_CWDS[ftp] = posixpath.normpath(
+                posixpath.join(_FTP_CWDS[ftp], dir_to_move_to)
+            )
+
+        cwd = _FTP_CWDS.get(ftp)
+
+    if cwd is not None:
+        logger.debug(f"Now in {cwd} on FTP server")
+
+    else:
+        # Lazy, so we only make the round trip to the server
+        # if the message is actually going to be logged.
+        logger.opt(lazy=True).debug("Now in {} on FTP server", ftp.pwd)
 
     return ftp
 
@@ -132,6 +489,37 @@ def mkdir_v(dir_to_make: str, ftp: ftplib.FTP) -> None:
         logger.debug(f"{dir_to_make} already exists on {ftp.host=}")
 
 
+def get_remote_file_size(filename: str, ftp: ftplib.FTP) -> Optional[int]:
+    """
+    Get the size of a file in the current directory on the FTP server
+
+    Parameters
+    ----------
+    filename
+        Name of the file
+
+    ftp
+        FTP connection
+
+    Returns
+    -------
+    :
+        Size of the file in bytes.
+
+        If the file doesn't exist
+        (or the server doesn't support or allow the `SIZE` command), `None`.
+    """
+    try:
+        # Sizes are only reliable in binary mode
+        ftp.voidcmd("TYPE I")
+        return ftp.size(filename)
+    except (ftplib.error_perm, ftplib.error_temp, ftplib.error_reply):
+        # Servers differ in how they say that the file is missing
+        # or that they won't tell us its size.
+        # Either way, we can't tell if the file is there, so upload as normal.
+        return None
+
+
 def upload_file(
     file: Path,
     strip_pre_upload: Path,
@@ -156,13 +544,17 @@ def upload_file(
         For example, if `file` is `/path/to/a/file/somewhere/file.nc`
         and `strip_pre_upload` is `/path/to/a`,
         then we will upload the file to `file/somewhere/file.nc` on the FTP server
-        (relative to whatever directory the FTP server is in
-        when we enter this function).
+        (relative to `ftp_dir_upload_in`).
 
     ftp_dir_upload_in
         Directory on the FTP server in which to upload `file`
         (after removing `strip_pre_upload`).
 
+        If this is a relative path, it is relative to the directory
+        the FTP connection started in, not wherever an earlier upload
+        using the same connection left it
+        (see [`get_ftp_login_dir`][input4mips_validation.upload_ftp.get_ftp_login_dir]).
+
     ftp
         FTP connection to use for the upload.
 
@@ -176,12 +568,6 @@ def upload_file(
         If it is a dry run, this can simply be `None`.
     """
     logger.debug(f"Uploading {file}")
-    if ftp is None:
-        logger.debug(f"Dry run. Would cd on the FTP server to {ftp_dir_upload_in}")
-
-    else:
-        cd_v(ftp_dir_upload_in, ftp=ftp)
-
     filepath_upload = file.relative_to(strip_pre_upload)
     logger.log(
         LOG_LEVEL_INFO_FILE.name,
@@ -189,33 +575,75 @@ def upload_file(
         f"will upload {file} to {filepath_upload}",
     )
 
-    for parent in list(filepath_upload.parents)[::-1]:
-        if parent == Path("."):
-            continue
-
-        to_make = parent.parts[-1]
-
-        if ftp is None:
+    upload_dir_parts = filepath_upload.parent.parts
+    if ftp is None:
+        logger.debug(f"Dry run. Would cd on the FTP server to {ftp_dir_upload_in}")
+        for to_make in upload_dir_parts:
             logger.debug(
                 "Dry run. "
                 "Would ensure existence of "
                 f"and cd on the FTP server to {to_make}"
             )
 
+    else:
+        # Connections are re-used for many files,
+        # so we can't rely on the server resolving a relative upload directory
+        # (the connection is wherever the previous upload left it).
+        # Resolve it against the directory the connection started in instead.
+        ftp_dir_upload_in = posixpath.normpath(
+            posixpath.join(get_ftp_login_dir(ftp), ftp_dir_upload_in)
+        )
+        # Absolute paths of the upload directory
+        # and of each directory between it and the file's directory
+        upload_dirs = [ftp_dir_upload_in]
+        for part in upload_dir_parts:
+            upload_dirs.append(posixpath.join(upload_dirs[-1], part))
+
+        # Find the deepest directory we already know exists on the server.
+        # We can go straight there, then only have to make what is missing.
+        known_dirs = get_known_ftp_dirs(ftp)
+        n_parts_known = 0
+        for n_parts in range(len(upload_dir_parts), 0, -1):
+            if upload_dirs[n_parts] in known_dirs:
+                n_parts_known = n_parts
+                break
+
+        if get_ftp_cwd(ftp) == upload_dirs[n_parts_known]:
+            # Already there (e.g. the previous file was in the same directory)
+            logger.debug(f"Already in {upload_dirs[n_parts_known]} on FTP server")
+
         else:
+            cd_v(upload_dirs[n_parts_known], ftp=ftp)
+
+        for n_parts in range(n_parts_known + 1, len(upload_dirs)):
+            to_make = upload_dir_parts[n_parts - 1]
             mkdir_v(to_make, ftp=ftp)
             cd_v(to_make, ftp=ftp)
+            known_dirs.add(upload_dirs[n_parts])
 
     if ftp is None:
         logger.log(LOG_LEVEL_INFO_FILE.name, f"Dry run. Would upload {file}")
 
         return ftp
 
-    with open(file, "rb") as fh:
+    # Unbuffered, storbinary already reads in blocks of the size we want
+    with open(file, "rb", buffering=0) as fh:
         upload_command = f"STOR {file.name}"
         logger.debug(f"Upload command: {upload_command}")
 
-        file_size = file.stat().st_size
+        # Use the open handle, which avoids resolving the path again
+        file_size = os.fstat(fh.fileno()).st_size
+        if get_remote_file_size(file.name, ftp=ftp) == file_size:
+            # Most likely uploaded already (e.g. by an earlier, interrupted run),
+            # so don't send the data again only to have the server refuse it.
+            logger.log(
+                LOG_LEVEL_INFO_FILE.name,
+                f"Skipping already-uploaded {file} "
+                "(a file with the same name and size is already on the server)",
+            )
+
+            return ftp
+
         try:
             with tqdm.tqdm(
                 total=file_size,
@@ -224,8 +652,12 @@ def upload_file(
                 unit_scale=True,
                 unit_divisor=1024,
             ) as pbar:
-                wrapped_file = tqdm.utils.CallbackIOWrapper(pbar.update, fh, "read")
-                ftp.storbinary(upload_command, wrapped_file)
+                ftp.storbinary(
+                    upload_command,
+                    fh,
+                    blocksize=UPLOAD_BLOCKSIZE,
+                    callback=lambda block: pbar.update(len(block)),
+                )
 
             logger.log(LOG_LEVEL_INFO_FILE.name, f"Successfully uploaded {file}")
         except ftplib.error_perm:
@@ -256,6 +688,134 @@ class FTPConnectionContextManager(Protocol):
         """Close the FTP connection"""
 
 
+class ThreadLocalFTPConnections:
+    """
+    Re-use a single FTP connection per thread
+
+    Logging in to the FTP server is slow compared to uploading small files.
+    Hence, when uploading in parallel,
+    we log in once per worker thread, rather than once per file.
+
+    Instances can be used anywhere a
+    [`GetFTPConnection`][input4mips_validation.upload_ftp.GetFTPConnection]
+    is expected.
+    Exiting the context manager returned by calling an instance
+    does not close the connection (unless an error was raised).
+    Instead, every connection that was opened is closed
+    when the context block in which the instance itself is used exits
+    (or when
+    [`close_all`][input4mips_validation.upload_ftp.ThreadLocalFTPConnections.close_all]
+    is called).
+    """  # noqa: E501
+
+    def __init__(self, get_ftp_connection: GetFTPConnection) -> None:
+        """
+        Initialise
+
+        Parameters
+        ----------
+        get_ftp_connection
+            Callable that returns a new FTP connection.
+
+            This is called at most once per thread.
+        """
+        self.get_ftp_connection = get_ftp_connection
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: list[AbstractContextManager[Optional[ftplib.FTP]]] = []
+
+    def __call__(self) -> AbstractContextManager[Optional[ftplib.FTP]]:
+        """
+        Get the FTP connection for the current thread
+
+        Returns
+        -------
+        :
+            Context manager which provides the current thread's connection.
+
+            The connection is created the first time it is requested
+            from each thread.
+            If an error is raised while using the connection,
+            the connection is closed
+            (it may be in a broken state)
+            and the next request from the thread gets a new connection.
+        """
+        return self.thread_connection()
+
+    @contextmanager
+    def thread_connection(self) -> Iterator[Optional[ftplib.FTP]]:
+        """
+        Get the FTP connection for the current thread
+
+        This is the implementation of
+        [`__call__`][input4mips_validation.upload_ftp.ThreadLocalFTPConnections.__call__].
+
+        Yields
+        ------
+        :
+            The current thread's connection
+        """  # noqa: E501
+        if not hasattr(self._local, "connection_cm"):
+            connection_cm = self.get_ftp_connection()
+            self._local.ftp = connection_cm.__enter__()
+            self._local.connection_cm = connection_cm
+            with self._lock:
+                self._opened.append(connection_cm)
+
+        ftp: Optional[ftplib.FTP] = self._local.ftp
+
+        try:
+            yield ftp
+
+        except BaseException as exc:
+            connection_cm = self._local.connection_cm
+            del self._local.ftp
+            del self._local.connection_cm
+            with self._lock:
+                self._opened.remove(connection_cm)
+
+            # Let the underlying context manager see the error,
+            # so it can close (rather than re-use) the connection.
+            connection_cm.__exit__(type(exc), exc, exc.__traceback__)
+            raise
+
+    def __enter__(self) -> ThreadLocalFTPConnections:
+        """
+        Enter the context block
+
+        Returns
+        -------
+        :
+            `self`
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """
+        Exit the context block, closing all connections
+        """
+        self.close_all()
+
+    def close_all(self) -> None:
+        """
+        Close all the connections that have been opened
+
+        Connections which have already been closed because of an error
+        are not included.
+        """
+        with self._lock:
+            opened = self._opened
+            self._opened = []
+
+        for connection_cm in opened:
+            connection_cm.__exit__(None, None, None)
+
+
 def upload_file_p(
     file: Path,
     strip_pre_upload: Path,
@@ -300,6 +860,102 @@ def upload_file_p(
         )
 
 
+def get_strip_pre_upload(directory: Path, cvs: Input4MIPsCVs) -> Path:
+    """
+    Get the part of a directory to strip before uploading files within it
+
+    Parameters
+    ----------
+    directory
+        Directory containing the file(s) to upload
+
+    cvs
+        CVs used when writing the files.
+
+        These are used to determine where the DRS path starts.
+
+    Returns
+    -------
+    :
+        Part of `directory` to strip before uploading.
+
+        If `directory` can't be resolved with the DRS,
+        this is `directory` itself
+        (i.e. the files are uploaded without any directory structure).
+    """
+    could_not_infer_root_data_dir = False
+    try:
+        directory_metadata = cvs.DRS.extract_metadata_from_path(
+            directory,
+            include_root_data_dir=True,
+        )
+
+        if directory_metadata["root_data_dir"] is None:
+            could_not_infer_root_data_dir = True
+
+    except AssertionError:
+        could_not_infer_root_data_dir = True
+
+    if could_not_infer_root_data_dir:
+        logger.warning(
+            f"Directory could not be resolved with the DRS, "
+            "we will upload the files in the following directory "
+            "without any directory structure. "
+            f"{directory=}. "
+            f"{cvs.DRS.directory_path_template=}"
+        )
+        return directory
+
+    if directory_metadata["root_data_dir"] is None:  # pragma: no cover
+        raise AssertionError
+
+    return Path(directory_metadata["root_data_dir"])
+
+
+def order_files_for_upload(files: Iterable[Path]) -> list[Path]:
+    """
+    Order files for uploading in parallel
+
+    Files are grouped by directory,
+    so each connection can upload many files without changing directory
+    (see [`upload_file`][input4mips_validation.upload_ftp.upload_file]).
+    The directories are ordered from largest to smallest (total size of their files)
+    and, within each directory, the files are ordered from largest to smallest.
+    If the biggest files are started first, the small files fill in the gaps
+    on the other connections.
+    This avoids a large file starting near the end
+    and leaving a single connection working long after the others have finished.
+
+    Parameters
+    ----------
+    files
+        Files to upload
+
+    Returns
+    -------
+    :
+        Files, ordered for uploading
+        (ties are ordered by path, so the result is deterministic).
+    """
+    sizes_files_by_dir: dict[Path, list[tuple[int, Path]]] = {}
+    for file in files:
+        sizes_files_by_dir.setdefault(file.parent, []).append(
+            (file.stat().st_size, file)
+        )
+
+    dir_sizes = {
+        directory: sum(size for size, _ in sizes_files)
+        for directory, sizes_files in sizes_files_by_dir.items()
+    }
+
+    res: list[Path] = []
+    for directory in sorted(dir_sizes, key=lambda v: (-dir_sizes[v], v)):
+        sizes_files = sorted(sizes_files_by_dir[directory], key=lambda v: (-v[0], v[1]))
+        res.extend(file for _, file in sizes_files)
+
+    return res
+
+
 def upload_files_p(  # noqa: PLR0913
     files_to_upload: Iterable[Path],
     get_ftp_connection: GetFTPConnection,
@@ -370,49 +1026,41 @@ def upload_files_p(  # noqa: PLR0913
         "Uploading in parallel using up to "
         f"{n_threads} {'threads' if n_threads > 1 else 'thread'}"
     )
-    with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as executor:
+    # Log in once per thread, rather than once per file.
+    # The executor is shut down (i.e. all uploads are finished)
+    # before the connections are closed.
+    with ThreadLocalFTPConnections(
+        get_ftp_connection
+    ) as get_thread_ftp_connection, concurrent.futures.ThreadPoolExecutor(
+        max_workers=n_threads
+    ) as executor:
         futures_dict = {}
+        # Many files share the same directory,
+        # so only work out what to strip once per directory.
+        strip_pre_upload_by_dir: dict[Path, Path] = {}
         for file in files_to_upload:
-            could_not_infer_root_data_dir = False
-            try:
-                directory_metadata = cvs.DRS.extract_metadata_from_path(
-                    file.parent,
-                    include_root_data_dir=True,
+            if file.parent not in strip_pre_upload_by_dir:
+                strip_pre_upload_by_dir[file.parent] = get_strip_pre_upload(
+                    file.parent, cvs=cvs
                 )
 
-                if directory_metadata["root_data_dir"] is None:
-                    could_not_infer_root_data_dir = True
-
-            except AssertionError:
-                could_not_infer_root_data_dir = True
-
-            if could_not_infer_root_data_dir:
-                logger.warning(
-                    f"Filepath could not be resolved with the DRS, "
-                    "we will upload the following file "
-                    "without any directory structure. "
-                    f"{file=}. "
-                    f"{cvs.DRS.directory_path_template=}"
-                )
-                strip_pre_upload = file.parent
-
-            else:
-                if directory_metadata["root_data_dir"] is None:  # pragma: no cover
-                    raise AssertionError
-
-                strip_pre_upload = Path(directory_metadata["root_data_dir"])
+            strip_pre_upload = strip_pre_upload_by_dir[file.parent]
 
             future_h = executor.submit(
                 upload_file_p,
                 file,
                 strip_pre_upload=strip_pre_upload,
                 ftp_dir_upload_in=f"{ftp_dir_root}/{ftp_dir_rel_to_root}",
-                get_ftp_connection=get_ftp_connection,
+                get_ftp_connection=get_thread_ftp_connection,
             )
             futures_dict[future_h] = file
 
         any_errors = False
-        for future in concurrent.futures.as_completed(futures_dict):
+        for future in tqdm.tqdm(
+            concurrent.futures.as_completed(futures_dict),
+            desc="Files uploaded",
+            total=len(futures_dict),
+        ):
             file = futures_dict[future]
             if continue_on_error:
                 try:
@@ -506,7 +1154,9 @@ def upload_ftp(  # noqa: PLR0913
     )
 
     upload_files_p(
-        files_to_upload=tree_root.rglob(rglob_input),
+        files_to_upload=order_files_for_upload(
+            iter_files_in_tree(tree_root, rglob_input)
+        ),
         get_ftp_connection=get_ftp_connection,
         ftp_dir_root=ftp_dir_root,
         ftp_dir_rel_to_root=ftp_dir_rel_to_root,
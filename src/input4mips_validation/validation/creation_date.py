@@ -5,11 +5,7 @@ Validation of the `creation_date` attribute
 from __future__ import annotations
 
 import datetime as dt
-
-from input4mips_validation.validation.regexp import (
-    DoesNotMatchRegexpError,
-    validate_matches_regexp,
-)
+import re
 
 CREATION_DATE_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
 """
@@ -31,6 +27,16 @@ This constant is exposed for clarity.
 If you change it, we do not guarantee correct performance of the codebase.
 """
 
+CREATION_DATE_REGEXP: re.Pattern[str] = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})Z"
+)
+"""
+Regular expression which matches [`CREATION_DATE_FORMAT`][input4mips_validation.validation.creation_date.CREATION_DATE_FORMAT]
+
+Each component of the date is captured in its own group
+(in the order year, month, day, hour, minute, second).
+"""  # noqa: E501
+
 
 def validate_creation_date(creation_date: str) -> None:
     """
@@ -46,18 +52,22 @@ def validate_creation_date(creation_date: str) -> None:
     ValueError
         `creation_date`'s value is not correctly formed
     """
+    msg = (
+        "The `creation_date` attribute must be of the form YYYY-MM-DDThh:mm:ssZ, "
+        "i.e. be an ISO 8601 timestamp in the UTC timezone. "
+        f"Received {creation_date=!r}"
+    )
+
+    match = CREATION_DATE_REGEXP.fullmatch(creation_date)
+    if match is None:
+        raise ValueError(msg)
+
     try:
-        validate_matches_regexp(
-            value=creation_date,
-            regexp_to_match=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$",
-        )
-
-        dt.datetime.strptime(creation_date, CREATION_DATE_FORMAT)
-
-    except (DoesNotMatchRegexpError, ValueError) as exc:
-        msg = (
-            "The `creation_date` attribute must be of the form YYYY-MM-DDThh:mm:ssZ, "
-            "i.e. be an ISO 8601 timestamp in the UTC timezone. "
-            f"Received {creation_date=!r}"
-        )
+        # The regexp fixes the format,
+        # so we only need to check that the values make a valid date.
+        # This is much quicker than parsing the string again with strptime.
+        year, month, day, hour, minute, second = map(int, match.groups())
+        dt.datetime(year, month, day, hour, minute, second)
+
+    except ValueError as exc:
         raise ValueError(msg) from exc
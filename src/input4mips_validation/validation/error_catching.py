@@ -195,6 +195,8 @@ class ValidationResultsStore:
             The wrapped function is altered so it always returns a result,
             irrespective of whether `func_to_call` raised an error not.
         """
+        # Doesn't depend on the call, so only create it once
+        success_msg = f"{func_description} ran without error"
 
         @wraps(func_to_call)
         def decorated(*args: P.args, **kwargs: P.kwargs) -> ValidationResult:
@@ -205,10 +207,7 @@ class ValidationResultsStore:
                     passed=True,
                     result=res_func,
                 )
-                logger.log(
-                    LOG_LEVEL_INFO_INDIVIDUAL_CHECK.name,
-                    f"{func_description} ran without error",
-                )
+                logger.log(LOG_LEVEL_INFO_INDIVIDUAL_CHECK.name, success_msg)
 
             except Exception as exc:
                 logger.log(
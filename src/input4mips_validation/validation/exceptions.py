@@ -4,13 +4,61 @@ Exceptions related to validation that don't obviously fit elsewhere
 
 from __future__ import annotations
 
-import shutil
-import subprocess
+import functools
 from pathlib import Path
 
+import netCDF4
+
 from input4mips_validation.database.database import Input4MIPsDatabaseEntryFile
 
 
+def get_netcdf_header(filepath: Path | str) -> str:
+    """
+    Get a summary of a netCDF file's header
+
+    This gives similar information to `ncdump -h`
+    (dimensions, variables and their attributes and global attributes),
+    but is generated in-process with [netCDF4][]
+    so we don't need to start a subprocess
+    (or have `ncdump` installed).
+
+    Parameters
+    ----------
+    filepath
+        File for which to get the header
+
+    Returns
+    -------
+    :
+        Summary of the file's header
+    """
+    with netCDF4.Dataset(filepath) as ds:
+        return "\n\n".join(
+            [str(ds), *(str(variable) for variable in ds.variables.values())]
+        )
+
+
+def format_caught_errors(error_container: list[tuple[str, Exception]]) -> str:
+    """
+    Format caught errors for display in an error message
+
+    Parameters
+    ----------
+    error_container
+        The thing which was being done
+        and the error which was caught.
+
+    Returns
+    -------
+    :
+        Formatted errors, one paragraph per error
+    """
+    return "\n\n".join(
+        f"{process} failed. Exception: {type(exc).__name__}: {exc}"
+        for process, exc in error_container
+    )
+
+
 class InvalidFileError(ValueError):
     """
     Raised when a file does not pass all of the validation
@@ -34,33 +82,48 @@ class InvalidFileError(ValueError):
             and the error which was caught
             while validating the file.
         """
-        # Not clear how input could be further validated hence noqa
-        ncdump_loc = shutil.which("ncdump")
-        if ncdump_loc is None:
-            msg = "Could not find ncdump executable"
-            raise AssertionError(msg)
+        self.filepath = filepath
+        self.error_container = error_container
 
-        # Not clear how input could be further validated hence noqa
-        file_ncdump_h = subprocess.check_output(
-            [ncdump_loc, "-h", str(filepath)]  # noqa: S603
-        ).decode()
+        super().__init__(filepath, error_container)
 
-        error_msgs: list[str] = []
-        for error in error_container:
-            process, exc = error
-            formatted_exc = f"{type(exc).__name__}: {exc}"
-            error_msgs.append(f"{process} failed. Exception: {formatted_exc}")
-
-        error_msgs_str = "\n\n".join(error_msgs)
+    @functools.cached_property
+    def error_msg(self) -> str:
+        """
+        Error message
 
-        error_msg = (
-            f"Failed to validate {filepath=}\n"
-            f"File's `ncdump -h` output:\n\n{file_ncdump_h}\n\n"
+        This is only created when it is first needed
+        (e.g. when the error is displayed),
+        because it requires reading the file's header.
+        Errors which are caught and never displayed
+        therefore don't pay this cost.
+        """
+        try:
+            file_header = get_netcdf_header(self.filepath)
+        except Exception as exc:
+            # The file may be invalid to the point that it can't be read,
+            # which shouldn't stop us from reporting the other errors.
+            file_header = f"Could not read header ({type(exc).__name__}: {exc})"
+
+        error_msgs_str = format_caught_errors(self.error_container)
+
+        return (
+            f"Failed to validate filepath={self.filepath!r}\n"
+            f"File's header:\n\n{file_header}\n\n"
             "Caught error messages:\n\n"
             f"{error_msgs_str}"
         )
 
-        super().__init__(error_msg)
+    def __str__(self) -> str:
+        """
+        Get string representation of the error
+
+        Returns
+        -------
+        :
+            Error message
+        """
+        return self.error_msg
 
 
 class InvalidTreeError(ValueError):
@@ -86,13 +149,7 @@ class InvalidTreeError(ValueError):
             and the error which was caught
             while validating the file.
         """
-        error_msgs: list[str] = []
-        for error in error_container:
-            process, exc = error
-            formatted_exc = f"{type(exc).__name__}: {exc}"
-            error_msgs.append(f"{process} failed. Exception: {formatted_exc}")
-
-        error_msgs_str = "\n\n".join(error_msgs)
+        error_msgs_str = format_caught_errors(error_container)
 
         error_msg = (
             f"Failed to validate {root=}\n"
@@ -126,13 +183,7 @@ class FileAssociatedWithDatabaseEntryError(ValueError):
             and the error which was caught
             while validating the file.
         """
-        error_msgs: list[str] = []
-        for error in error_container:
-            process, exc = error
-            formatted_exc = f"{type(exc).__name__}: {exc}"
-            error_msgs.append(f"{process} failed. Exception: {formatted_exc}")
-
-        error_msgs_str = "\n\n".join(error_msgs)
+        error_msgs_str = format_caught_errors(error_container)
 
         error_msg = (
             f"Failed to validate {entry=}\n"
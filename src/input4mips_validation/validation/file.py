@@ -4,6 +4,7 @@ Validation of an individual file in isolation
 
 from __future__ import annotations
 
+import concurrent.futures
 from pathlib import Path
 from typing import Union
 
@@ -34,6 +35,110 @@ from input4mips_validation.xarray_helpers.variables import (
 )
 
 
+def start_loading_cvs_if_needed(
+    cv_source: str | None, cvs: Input4MIPsCVs | None
+) -> concurrent.futures.Future[Input4MIPsCVs] | None:
+    """
+    Start loading the CVs in the background, if they haven't been provided
+
+    Loading CVs is I/O bound (it may even require downloading them),
+    so this lets us load the file to validate at the same time.
+
+    Parameters
+    ----------
+    cv_source
+        Source from which to load the CVs
+
+    cvs
+        CVs which have already been loaded.
+
+        If these are provided, `cv_source` is ignored.
+
+    Returns
+    -------
+    :
+        Future which gives the loaded CVs.
+
+        If `cvs` is provided, `None`.
+        Any error raised while loading the CVs
+        is raised when the future's result is retrieved.
+    """
+    if cvs is not None:
+        if cv_source is not None:
+            logger.warning(
+                "Ignoring provided value for `cv_source` (using provided cvs instead)."
+            )
+
+        return None
+
+    cvs_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    cvs_future = cvs_executor.submit(load_cvs, cv_source=cv_source)
+    # Doesn't cancel the submitted work,
+    # just means the thread is cleaned up once the work is done.
+    cvs_executor.shutdown(wait=False)
+
+    return cvs_future
+
+
+def get_drs_validation_result(  # noqa: PLR0913
+    infile: Path | str,
+    cvs: Input4MIPsCVs | None,
+    vrs: ValidationResultsStore,
+    ds: xr.Dataset | None = None,
+    frequency_metadata_keys: FrequencyMetadataKeys = FrequencyMetadataKeys(),
+    time_dimension: str = "time",
+) -> ValidationResultsStore:
+    """
+    Get the result of checking that a file is written according to the DRS
+
+    Parameters
+    ----------
+    infile
+        Path to the file to check
+
+    cvs
+        CVs to use for the check.
+
+        If `None`, the check is skipped
+        (we assume that an error has already been recorded
+        because the CVs could not be loaded).
+
+    vrs
+        The validation results store to use for the validation.
+
+    ds
+        `infile`, already opened with [xr.open_dataset][xarray.open_dataset].
+
+        If not supplied, `infile` is opened during the check.
+
+    frequency_metadata_keys
+        Metadata definitions for frequency information
+
+    time_dimension
+        The time dimension of the data
+
+    Returns
+    -------
+    :
+        The validation results store.
+    """
+    if cvs is None:
+        logger.error("Skipping check of consistency with DRS because CVs did not load")
+        return vrs
+
+    vrs.wrap(
+        cvs.DRS.validate_file_written_according_to_drs,
+        func_description="Check file is written according to the DRS",
+    )(
+        Path(infile),
+        frequency_metadata_keys=frequency_metadata_keys,
+        time_dimension=time_dimension,
+        ds=ds,
+    )
+
+    return vrs
+
+
 def get_validate_file_result(  # noqa: PLR0913
     infile: Path | str,
     cv_source: str | None = None,
@@ -44,6 +149,7 @@ def get_validate_file_result(  # noqa: PLR0913
     time_dimension: str = "time",
     allow_cf_checker_warnings: bool = False,
     vrs: Union[ValidationResultsStore, None] = None,
+    check_drs: bool = False,
 ) -> ValidationResultsStore:
     """
     Get the result of validating a file
@@ -97,6 +203,14 @@ def get_validate_file_result(  # noqa: PLR0913
         [`ValidationResultsStore`][input4mips_validation.validation.error_catching.ValidationResultsStore]
         instance.
 
+    check_drs
+        Should we also check that the file is written according to the DRS?
+
+        This only makes sense if the file is in a tree
+        which follows the DRS (e.g. when validating a tree),
+        hence it is off by default.
+        Doing the check here means the file is only opened once.
+
     Returns
     -------
     :
@@ -110,17 +224,7 @@ def get_validate_file_result(  # noqa: PLR0913
         logger.debug("Instantiating a new `ValidationResultsStore`")
         vrs = ValidationResultsStore()
 
-    if cvs is None:
-        # Load CVs, we need them for the following steps
-        cvs = vrs.wrap(
-            load_cvs,
-            func_description="Load controlled vocabularies to use during validation",
-        )(cv_source=cv_source).result
-
-    elif cv_source is not None:
-        logger.warning(
-            "Ignoring provided value for `cv_source` (using provided cvs instead)."
-        )
+    cvs_future = start_loading_cvs_if_needed(cv_source=cv_source, cvs=cvs)
 
     # Basic loading - xarray
     ds_xr_open = vrs.wrap(
@@ -156,6 +260,12 @@ def get_validate_file_result(  # noqa: PLR0913
             infile, ds=ds_xr_open, no_raise_if_only_warnings=allow_cf_checker_warnings
         )
 
+    if cvs_future is not None:
+        cvs = vrs.wrap(
+            cvs_future.result,
+            func_description="Load controlled vocabularies to use during validation",
+        )().result
+
     if cvs is None:
         logger.error("Skipping checks of CV consistency because cvs loading failed")
 
@@ -187,6 +297,16 @@ def get_validate_file_result(  # noqa: PLR0913
             time_dimension=time_dimension,
         )
 
+    if check_drs:
+        vrs = get_drs_validation_result(
+            infile,
+            cvs=cvs,
+            vrs=vrs,
+            ds=ds_xr_open,
+            frequency_metadata_keys=frequency_metadata_keys,
+            time_dimension=time_dimension,
+        )
+
     logger.log(
         LOG_LEVEL_INFO_FILE.name, f"Created validation results for file: {infile}"
     )
@@ -7,13 +7,14 @@ from __future__ import annotations
 from collections.abc import Collection
 from pathlib import Path
 
+import netCDF4
 import tqdm
-import xarray as xr
 from attrs import define, field
 from loguru import logger
 
 from input4mips_validation.cvs import Input4MIPsCVs, load_cvs
 from input4mips_validation.exceptions import NonUniqueError
+from input4mips_validation.file_search import iter_files_in_tree
 from input4mips_validation.inference.from_data import BoundsInfo, FrequencyMetadataKeys
 from input4mips_validation.validation.error_catching import (
     ValidationResult,
@@ -42,9 +43,13 @@ def validate_tracking_ids_are_unique(files: Collection[Path]) -> None:
     NonUniqueError
         Not all the tracking IDs are unique
     """
-    tracking_ids = [
-        xr.open_dataset(f, use_cftime=True).attrs["tracking_id"] for f in files
-    ]
+    tracking_ids: list[str] = []
+    for f in files:
+        # Only the global attributes are needed,
+        # so read them directly rather than building a full dataset
+        with netCDF4.Dataset(f) as ds:
+            tracking_ids.append(ds.getncattr("tracking_id"))
+
     if len(set(tracking_ids)) != len(files):
         raise NonUniqueError(
             description="Tracking IDs for all files should be unique",
@@ -445,7 +450,7 @@ def get_validate_tree_result(  # noqa: PLR0913
             "Ignoring provided value for `cv_source` (using provided cvs instead)."
         )
 
-    all_files = [v for v in root.rglob(rglob_input) if v.is_file()]
+    all_files = list(iter_files_in_tree(root, rglob_input))
 
     vrs_general.wrap(
         validate_tracking_ids_are_unique,
@@ -464,24 +469,11 @@ def get_validate_tree_result(  # noqa: PLR0913
             xr_variable_processor=xr_variable_processor,
             frequency_metadata_keys=frequency_metadata_keys,
             bounds_info=bounds_info,
+            time_dimension=time_dimension,
             allow_cf_checker_warnings=allow_cf_checker_warnings,
+            check_drs=True,
         )
 
-        if cvs is None:
-            logger.error(
-                "Skipping check of consistency with DRS because CVs did not load"
-            )
-
-        else:
-            validate_file_result.wrap(
-                cvs.DRS.validate_file_written_according_to_drs,
-                func_description="Check file is written according to the DRS",
-            )(
-                file,
-                frequency_metadata_keys=frequency_metadata_keys,
-                time_dimension=time_dimension,
-            )
-
         # TODO: check cross references in files to external variables
         # e.g. areacella with cf-python
 
@@ -119,3 +119,49 @@ def test_validate_written_single_variable_file(tmp_path):
         )
 
     assert result.exit_code == 0, result.exc_info
+
+
+def test_validate_file_cvs_fail_to_load(tmp_path):
+    """
+    Test that a failure to load the CVs is reported
+
+    The CVs are loaded in the background while the file is loaded,
+    so this makes sure that errors from the background loading aren't lost.
+    """
+    variable_name = "mole_fraction_of_carbon_dioxide_in_air"
+    ds, metadata_minimum = get_valid_ds_min_metadata_example(variable_id=variable_name)
+
+    with patch.dict(
+        os.environ,
+        {"INPUT4MIPS_VALIDATION_CV_SOURCE": str(DEFAULT_TEST_INPUT4MIPS_CV_SOURCE)},
+    ):
+        input4mips_ds = Input4MIPsDataset.from_data_producer_minimum_information(
+            data=ds,
+            metadata_minimum=metadata_minimum,
+            prepare_func=partial(
+                prepare_ds_and_get_frequency,
+                standard_and_or_long_names={
+                    variable_name: {"standard_name": variable_name}
+                },
+            ),
+        )
+
+    written_file = input4mips_ds.write(root_data_dir=tmp_path / "data")
+
+    res = get_validate_file_result(
+        written_file,
+        cv_source=str(tmp_path / "non-existent-cvs"),
+        check_drs=True,
+    )
+
+    failing = {v.description for v in res.checks_failing}
+    assert failing == {"Load controlled vocabularies to use during validation"}
+
+    # The checks which need the CVs are skipped
+    descriptions = {v.description for v in res.validation_results}
+    assert "Open data with `xr.open_dataset`" in descriptions
+    assert "Check file is written according to the DRS" not in descriptions
+
+    error_msg = re.escape("Load controlled vocabularies to use during validation")
+    with pytest.raises(ValidationResultsStoreError, match=error_msg):
+        res.raise_if_errors()
@@ -2,6 +2,7 @@
 Tests of path parsing with the DRS
 """
 
+import re
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
 
@@ -263,3 +264,41 @@ def test_validate_file_written_according_to_drs(  # noqa: PLR0913
 
     with exp_raise:
         drs.validate_file_written_according_to_drs(file=tmp_out)
+
+
+def test_validate_file_written_according_to_drs_missing_attribute(tmpdir):
+    tmp_out = (
+        Path(tmpdir)
+        / "input4MIPs"
+        / "CR-CMIP-1-0-0"
+        / "co2_em_anthro"
+        / "co2-em-anthro_CR-CMIP-1-0-0.nc"
+    )
+    tmp_out.parent.mkdir(exist_ok=False, parents=True)
+
+    # No source_id attribute
+    global_attributes = {
+        "activity_id": "input4MIPs",
+        "variable_id": "co2_em_anthro",
+        "frequency": "fx",
+    }
+    xr.DataArray(
+        np.arange(3.0),
+        dims=("lat",),
+        name=global_attributes["variable_id"],
+        attrs=global_attributes,
+    ).to_dataset(promote_attrs=True).to_netcdf(tmp_out)
+
+    drs = DataReferenceSyntax(
+        directory_path_template="<activity_id>/<source_id>/<variable_id>",
+        directory_path_example="not_used",
+        filename_template="<variable_id>_<source_id>[_<time_range>].nc",
+        filename_example="not_used",
+    )
+
+    error_msg = (
+        "Mismatch in directory for source_id. "
+        "filepath_val='CR-CMIP-1-0-0' expected_val=None"
+    )
+    with pytest.raises(ValueError, match=re.escape(error_msg)):
+        drs.validate_file_written_according_to_drs(file=tmp_out)
@@ -0,0 +1,69 @@
+"""
+Tests of `input4mips_validation.dataset.dataset.handle_ds_standard_long_names`
+"""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from input4mips_validation.dataset.dataset import handle_ds_standard_long_names
+
+
+def get_ds() -> xr.Dataset:
+    ds = xr.Dataset(
+        data_vars={
+            "co2": (("lat",), np.arange(3.0), {"standard_name": "co2"}),
+            "lat_bounds": (("lat", "bounds"), np.zeros((3, 2))),
+        },
+        coords=dict(
+            lat=("lat", [-60.0, 0.0, 60.0], {"standard_name": "latitude"}),
+            bounds=("bounds", [0, 1]),
+        ),
+    )
+    ds["lat"].attrs["bounds"] = "lat_bounds"
+
+    return ds
+
+
+def test_bounds_variables_skipped():
+    ds = get_ds()
+
+    res = handle_ds_standard_long_names(
+        ds, standard_and_or_long_names=None, bounds_indicator="bounds"
+    )
+
+    xr.testing.assert_identical(res, ds)
+
+
+def test_variable_containing_bounds_indicator_not_skipped():
+    ds = get_ds()
+    ds["rebounds_count"] = ("lat", np.arange(3.0))
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Variable rebounds_count "
+            "does not have either standard_name or long_name set"
+        ),
+    ):
+        handle_ds_standard_long_names(
+            ds, standard_and_or_long_names=None, bounds_indicator="bounds"
+        )
+
+
+def test_standard_and_or_long_names_applied():
+    ds = get_ds()
+    ds["rebounds_count"] = ("lat", np.arange(3.0))
+
+    res = handle_ds_standard_long_names(
+        ds,
+        standard_and_or_long_names={"rebounds_count": {"long_name": "Rebounds"}},
+        bounds_indicator="bounds",
+    )
+
+    assert res["rebounds_count"].attrs["long_name"] == "Rebounds"
+    assert "standard_name" not in res["rebounds_count"].attrs
@@ -11,7 +11,7 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from input4mips_validation.inference.from_data import BoundsInfo
+from input4mips_validation.inference.from_data import BoundsInfo, infer_frequency
 
 RNG = np.random.default_rng()
 
@@ -232,3 +232,54 @@ def test_can_not_guess_bounds_var():
     )
     with pytest.raises(AssertionError, match=exp_error_msg):
         BoundsInfo.from_ds(ds)
+
+
+def get_monthly_ds() -> xr.Dataset:
+    time_axis = [
+        cftime.datetime(y, m, 16) for y in range(2020, 2023) for m in range(1, 13)
+    ]
+    time_bounds = [
+        [
+            cftime.datetime(dt.year, dt.month, 1),
+            cftime.datetime(
+                dt.year if dt.month < 12 else dt.year + 1,
+                dt.month + 1 if dt.month < 12 else 1,
+                1,
+            ),
+        ]
+        for dt in time_axis
+    ]
+
+    ds = xr.Dataset(
+        data_vars={
+            "co2": (("time",), RNG.random(len(time_axis))),
+        },
+        coords=dict(
+            time=("time", time_axis),
+            time_bounds=(("time", "bounds"), time_bounds),
+            bounds=("bounds", [0, 1]),
+        ),
+        attrs={},
+    )
+    ds["time"].attrs["bounds"] = "time_bounds"
+
+    return ds
+
+
+@pytest.mark.parametrize(
+    "attrs",
+    (
+        pytest.param({}, id="no-declared-frequency"),
+        pytest.param({"frequency": "mon"}, id="declared-frequency-consistent"),
+        pytest.param({"frequency": "yr"}, id="declared-frequency-inconsistent"),
+    ),
+)
+def test_infer_frequency_with_frequency_metadata_key(attrs):
+    ds = get_monthly_ds()
+    ds.attrs = attrs
+
+    res = infer_frequency(
+        ds, no_time_axis_frequency="fx", frequency_metadata_key="frequency"
+    )
+
+    assert res == "mon"
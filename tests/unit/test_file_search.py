@@ -0,0 +1,32 @@
+"""
+Tests of `input4mips_validation.file_search`
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from input4mips_validation.file_search import iter_files_in_tree
+
+
+@pytest.mark.parametrize("pattern", ("*.nc", "*", "sub/*.nc"))
+def test_iter_files_in_tree_matches_rglob(tmp_path, pattern):
+    for path in (
+        "a.nc",
+        "b.txt",
+        "sub/c.nc",
+        "sub/deeper/d.nc",
+        "other/sub/e.nc",
+    ):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+
+    # A directory which matches the pattern shouldn't be returned
+    (tmp_path / "dir.nc").mkdir()
+
+    exp = {v for v in tmp_path.rglob(pattern) if v.is_file()}
+
+    res = list(iter_files_in_tree(tmp_path, pattern))
+
+    assert len(res) == len(exp)
+    assert set(res) == exp
@@ -0,0 +1,23 @@
+"""
+Tests of `input4mips_validation.hashing`
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from input4mips_validation.hashing import get_file_hash_sha256
+
+
+@pytest.mark.parametrize("buffer_size", (7, 2**10, 2**20))
+@pytest.mark.parametrize("file_size", (0, 1000, 2**10, 5 * 2**10 + 3))
+def test_get_file_hash_sha256(tmp_path, buffer_size, file_size):
+    contents = bytes(i % 251 for i in range(file_size))
+    file = tmp_path / "file.bin"
+    file.write_bytes(contents)
+
+    res = get_file_hash_sha256(file, buffer_size=buffer_size)
+
+    assert res == hashlib.sha256(contents).hexdigest()
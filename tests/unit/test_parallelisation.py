@@ -0,0 +1,59 @@
+"""
+Tests of `input4mips_validation.parallelisation`
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from input4mips_validation.parallelisation import (
+    get_chunksize,
+    run_parallel,
+    run_parallel_iter,
+)
+
+
+def add(a: int, b: int, c: int = 0) -> int:
+    return a + b + c
+
+
+@pytest.mark.parametrize(
+    "n_items, n_processes, exp",
+    (
+        pytest.param(1, 4, 1, id="fewer-items-than-processes"),
+        pytest.param(0, 4, 1, id="no-items"),
+        pytest.param(100, 4, 6, id="many-items"),
+        pytest.param(16, 4, 1, id="one-item-per-chunk"),
+    ),
+)
+def test_get_chunksize(n_items, n_processes, exp):
+    assert get_chunksize(n_items=n_items, n_processes=n_processes) == exp
+
+
+@pytest.mark.parametrize("n_processes", (1, 2))
+def test_run_parallel(n_processes):
+    res = run_parallel(
+        add,
+        range(50),
+        "ints",
+        n_processes,
+        None,
+        3,
+        c=10,
+    )
+
+    assert res == tuple(v + 3 + 10 for v in range(50))
+
+
+def test_run_parallel_unsized_input():
+    res = run_parallel(add, (v for v in range(30)), "ints", 3, None, 3, c=10)
+
+    assert res == tuple(v + 3 + 10 for v in range(30))
+
+
+@pytest.mark.parametrize("n_processes", (1, 2))
+def test_run_parallel_iter(n_processes):
+    res = run_parallel_iter(add, range(50), "ints", n_processes, None, 3, c=10)
+
+    assert not isinstance(res, tuple)
+    assert list(res) == [v + 3 + 10 for v in range(50)]
@@ -0,0 +1,293 @@
+"""
+Tests of `input4mips_validation.upload_ftp`
+"""
+
+from __future__ import annotations
+
+import ftplib
+import posixpath
+from contextlib import contextmanager
+
+import pytest
+
+from input4mips_validation.upload_ftp import (
+    FTPConnectionPool,
+    ThreadLocalFTPConnections,
+    get_known_ftp_dirs,
+    get_remote_file_size,
+    order_files_for_upload,
+    upload_file,
+)
+
+
+class ConnectionTracker:
+    def __init__(self):
+        self.opened = []
+        self.closed = []
+        self.closed_after_error = []
+
+    @contextmanager
+    def get_ftp_connection(self):
+        ftp = object()
+        self.opened.append(ftp)
+        try:
+            yield ftp
+        except BaseException:
+            self.closed_after_error.append(ftp)
+            raise
+
+        self.closed.append(ftp)
+
+
+def test_thread_local_connection_reused():
+    tracker = ConnectionTracker()
+
+    with ThreadLocalFTPConnections(tracker.get_ftp_connection) as get_connection:
+        with get_connection() as ftp_1:
+            pass
+
+        with get_connection() as ftp_2:
+            pass
+
+        assert ftp_1 is ftp_2
+        assert tracker.closed == []
+
+    assert tracker.opened == [ftp_1]
+    assert tracker.closed == [ftp_1]
+
+
+def test_thread_local_connection_replaced_after_error():
+    tracker = ConnectionTracker()
+
+    with ThreadLocalFTPConnections(tracker.get_ftp_connection) as get_connection:
+        with pytest.raises(ValueError, match="upload failed"):
+            with get_connection() as ftp_broken:
+                msg = "upload failed"
+                raise ValueError(msg)
+
+        assert tracker.closed_after_error == [ftp_broken]
+
+        with get_connection() as ftp_new:
+            pass
+
+        assert ftp_new is not ftp_broken
+
+    # Only the healthy connection is closed normally
+    assert tracker.closed == [ftp_new]
+    assert tracker.closed_after_error == [ftp_broken]
+
+
+class FakeFTP:
+    host = "ftp.example.com"
+
+    def __init__(self, noop_reply="200 NOOP ok"):
+        self.noop_reply = noop_reply
+        self.quit_called = False
+
+    def sendcmd(self, cmd):
+        assert cmd == "NOOP"
+        return self.noop_reply
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_reuses_connection_and_forgets_state():
+    pool = FTPConnectionPool()
+    ftp = FakeFTP()
+    get_known_ftp_dirs(ftp).add("/incoming/somewhere")
+
+    pool.release("server", "user", ftp)
+
+    assert get_known_ftp_dirs(ftp) == set()
+    assert pool.get_idle_connection("server", "user") is ftp
+    assert pool.get_idle_connection("server", "user") is None
+
+
+def test_pool_discards_out_of_sync_connection():
+    pool = FTPConnectionPool()
+    # A stale reply from an earlier, aborted transfer
+    ftp = FakeFTP(noop_reply="226 Transfer complete")
+
+    pool.release("server", "user", ftp)
+
+    assert pool.get_idle_connection("server", "user") is None
+    assert ftp.quit_called
+
+
+class FakeFTPServer:
+    host = "ftp.example.com"
+
+    def __init__(self, login_dir, dirs):
+        self.current_dir = login_dir
+        self.dirs = {login_dir, *dirs}
+        self.stored = {}
+        self.commands = []
+
+    def resolve(self, path):
+        return posixpath.normpath(posixpath.join(self.current_dir, path))
+
+    def pwd(self):
+        self.commands.append("PWD")
+        return self.current_dir
+
+    def cwd(self, path):
+        self.commands.append(f"CWD {path}")
+        if self.resolve(path) not in self.dirs:
+            msg = f"550 {path}: No such directory"
+            raise ftplib.error_perm(msg)  # noqa: S321
+
+        self.current_dir = self.resolve(path)
+
+    def mkd(self, path):
+        self.commands.append(f"MKD {path}")
+        if self.resolve(path) in self.dirs:
+            msg = f"550 {path}: Directory exists"
+            raise ftplib.error_perm(msg)  # noqa: S321
+
+        self.dirs.add(self.resolve(path))
+
+    def voidcmd(self, cmd):
+        return "200 OK"
+
+    def size(self, filename):
+        if self.resolve(filename) not in self.stored:
+            msg = f"550 {filename}: No such file"
+            raise ftplib.error_perm(msg)  # noqa: S321
+
+        return len(self.stored[self.resolve(filename)])
+
+    def storbinary(self, cmd, fp, blocksize, callback):
+        data = fp.read()
+        self.stored[self.resolve(cmd.removeprefix("STOR "))] = data
+        callback(data)
+
+
+def test_upload_file_relative_root_re_used_connection(tmp_path):
+    for path in ("a/file_a.nc", "b/file_b.nc"):
+        (tmp_path / path).parent.mkdir()
+        (tmp_path / path).write_bytes(b"data")
+
+    ftp = FakeFTPServer(login_dir="/home/user", dirs={"/home/user/incoming"})
+    for path in ("a/file_a.nc", "b/file_b.nc"):
+        upload_file(
+            tmp_path / path,
+            strip_pre_upload=tmp_path,
+            ftp_dir_upload_in="incoming",
+            ftp=ftp,
+        )
+
+    # Both files are uploaded relative to the directory the connection started in,
+    # not relative to wherever the previous upload left the connection.
+    assert set(ftp.stored) == {
+        "/home/user/incoming/a/file_a.nc",
+        "/home/user/incoming/b/file_b.nc",
+    }
+    # The starting directory is only requested once
+    assert ftp.commands.count("PWD") == 1
+
+
+def test_upload_file_known_dirs_relative_root(tmp_path):
+    for path in ("a/b/file_1.nc", "a/c/file_2.nc", "a/c/file_3.nc"):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_bytes(b"data")
+
+    ftp = FakeFTPServer(login_dir="/home/user", dirs={"/home/user/incoming"})
+
+    def upload(path):
+        ftp.commands.clear()
+        upload_file(
+            tmp_path / path,
+            strip_pre_upload=tmp_path,
+            ftp_dir_upload_in="incoming",
+            ftp=ftp,
+        )
+
+        return [c for c in ftp.commands if c.startswith(("CWD", "MKD"))]
+
+    assert upload("a/b/file_1.nc") == [
+        "CWD /home/user/incoming",
+        "MKD a",
+        "CWD a",
+        "MKD b",
+        "CWD b",
+    ]
+    assert get_known_ftp_dirs(ftp) == {
+        "/home/user/incoming/a",
+        "/home/user/incoming/a/b",
+    }
+
+    # Straight to the deepest directory we know exists,
+    # even though the upload directory is relative
+    assert upload("a/c/file_2.nc") == [
+        "CWD /home/user/incoming/a",
+        "MKD c",
+        "CWD c",
+    ]
+
+    # Already in the right directory
+    assert upload("a/c/file_3.nc") == []
+
+    assert set(ftp.stored) == {
+        "/home/user/incoming/a/b/file_1.nc",
+        "/home/user/incoming/a/c/file_2.nc",
+        "/home/user/incoming/a/c/file_3.nc",
+    }
+
+
+class FakeFTPSize:
+    def __init__(self, size_result):
+        self.size_result = size_result
+
+    def voidcmd(self, cmd):
+        assert cmd == "TYPE I"
+        return "200 Switching to Binary mode."
+
+    def size(self, filename):
+        if isinstance(self.size_result, Exception):
+            raise self.size_result
+
+        return self.size_result
+
+
+def test_get_remote_file_size():
+    assert get_remote_file_size("file.nc", ftp=FakeFTPSize(1024)) == 1024
+
+
+@pytest.mark.parametrize(
+    "exc_type, reply",
+    (
+        pytest.param(ftplib.error_perm, "550 No such file", id="error_perm"),
+        pytest.param(ftplib.error_temp, "450 Not available", id="error_temp"),
+        pytest.param(ftplib.error_reply, "150 Unexpected", id="error_reply"),
+    ),
+)
+def test_get_remote_file_size_unknown(exc_type, reply):
+    ftp = FakeFTPSize(exc_type(reply))
+
+    assert get_remote_file_size("file.nc", ftp=ftp) is None
+
+
+def test_order_files_for_upload(tmp_path):
+    sizes = {
+        "small_dir/a.nc": 10,
+        "small_dir/b.nc": 20,
+        "big_dir/c.nc": 5,
+        "big_dir/d.nc": 50,
+        "big_dir/e.nc": 30,
+    }
+    for path, size in sizes.items():
+        (tmp_path / path).parent.mkdir(exist_ok=True)
+        (tmp_path / path).write_bytes(b"0" * size)
+
+    res = order_files_for_upload(tmp_path / path for path in sizes)
+
+    # Grouped by directory (largest directory first),
+    # then largest file first within each directory
+    assert res == [
+        tmp_path / "big_dir/d.nc",
+        tmp_path / "big_dir/e.nc",
+        tmp_path / "big_dir/c.nc",
+        tmp_path / "small_dir/b.nc",
+        tmp_path / "small_dir/a.nc",
+    ]
@@ -60,6 +60,16 @@ EXP_ERROR_MSG = "".join(
             pytest.raises(ValueError, match=EXP_ERROR_MSG),
             id="invalid-second",
         ),
+        pytest.param(
+            "2023-02-29T01:01:01Z",
+            pytest.raises(ValueError, match=EXP_ERROR_MSG),
+            id="invalid-leap-day",
+        ),
+        pytest.param(
+            "2024-08-01T08:03:04Z\n",
+            pytest.raises(ValueError, match=EXP_ERROR_MSG),
+            id="trailing-newline",
+        ),
     ),
 )
 def test_creation_date_validation(creation_date, expectation):
@@ -0,0 +1,62 @@
+"""
+Tests of `input4mips_validation.validation.exceptions.InvalidFileError`
+"""
+
+from __future__ import annotations
+
+import netCDF4
+
+from input4mips_validation.validation.exceptions import InvalidFileError
+
+
+def test_header_not_read_until_displayed(tmp_path, monkeypatch):
+    header_calls = []
+
+    def get_netcdf_header_counting(filepath):
+        header_calls.append(filepath)
+        return "File header"
+
+    monkeypatch.setattr(
+        "input4mips_validation.validation.exceptions.get_netcdf_header",
+        get_netcdf_header_counting,
+    )
+
+    error = InvalidFileError(
+        tmp_path / "file.nc", [("Check something", ValueError("bad"))]
+    )
+
+    assert header_calls == []
+
+    str(error)
+    error_str = str(error)
+
+    # Read once, when first displayed, then re-used
+    assert header_calls == [tmp_path / "file.nc"]
+    assert "File header" in error_str
+
+
+def test_str_includes_header_and_errors(tmp_path):
+    filepath = tmp_path / "file.nc"
+    with netCDF4.Dataset(filepath, "w") as ds:
+        ds.createDimension("lat", 3)
+        variable = ds.createVariable("lat", "f8", ("lat",))
+        variable.units = "degrees_north"
+        ds.setncattr("variable_id", "co2")
+
+    error = InvalidFileError(filepath, [("Check something", ValueError("bad"))])
+    error_str = str(error)
+
+    assert "degrees_north" in error_str
+    assert "variable_id: co2" in error_str
+    assert "Check something failed. Exception: ValueError: bad" in error_str
+
+
+def test_str_unreadable_file(tmp_path):
+    filepath = tmp_path / "file.nc"
+    filepath.write_text("Not a netCDF file")
+
+    error = InvalidFileError(filepath, [("Check something", ValueError("bad"))])
+    error_str = str(error)
+
+    assert "Could not read header" in error_str
+    assert "Check something failed. Exception: ValueError: bad" in error_str